@@ -1,11 +1,12 @@
-from config.bedrock_client import BedrockClient
+from config.bedrock_client import get_client
 from agents.strands_tools import correlate_alerts
 from config.knowledge_base import kb
 from config.terminal_logger import terminal_logger
 import os
 import json
 
-client = BedrockClient(region_name=os.getenv("AWS_REGION", "us-east-1"))
+client = get_client()
+MODEL_ID = os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514")
 
 ALERT_OPS_SYSTEM_PROMPT = """You are AlertOps, an expert alert correlation agent with memory.
 
@@ -40,7 +41,7 @@ def analyze_alert_stream_with_memory(alerts):
     ]
 
     # NARRATIVE: Check historical context
-    keywords = list(set([a.title.split()[0] for a in alerts]))
+    keywords = list({a.title.partition(' ')[0] for a in alerts})
     terminal_logger.add_log(
         f"AlertOps checking knowledge base for similar past incidents (keywords: {', '.join(keywords[:3])})",
         "ALERTOPS"
@@ -92,7 +93,7 @@ Based on this correlation analysis and your memory, provide:
 
     # Call Bedrock API
     response = client.messages.create(
-        model=os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514"),
+        model=MODEL_ID,
         max_tokens=1024,
         system=ALERT_OPS_SYSTEM_PROMPT,
         messages=[
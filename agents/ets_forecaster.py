@@ -1,29 +1,113 @@
 """
 Lightweight ETS-style (exponential smoothing with trend) forecaster for PredictiveOps.
-Uses a simple Holt linear trend model to avoid external heavy dependencies while
+Uses a simple Holt linear trend model instead of a full statistics package while
 still providing short-horizon forecasts and residual-based anomaly scores.
+
+The smoothing recurrence runs in a NumPy kernel that is JIT-compiled when numba
+is installed (see config.jit) and falls back to plain Python otherwise.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Sequence, Tuple
 
+import numpy as np
+import pandas as pd
+
+from config.jit import njit
+
+DEFAULT_ALPHA = 0.4
+DEFAULT_BETA = 0.2
+
 
 @dataclass
 class HoltLinearResult:
     level: float
     trend: float
-    fitted: List[float]
-    forecast: List[float]
-    residuals: List[float]
+    fitted: np.ndarray
+    forecast: np.ndarray
+    residuals: np.ndarray
+    resid_mean: float = 0.0
+    resid_std: float = 0.0
+
+
+@njit(cache=True, nogil=True)
+def _holt_kernel(values, alpha, beta):
+    """Run the Holt recurrence over a float64 series (len >= 2).
+
+    Residual mean/std (population) are accumulated in the same pass with
+    Welford's update so callers never need a second traversal.
+
+    Returns:
+        (fitted, residuals, level, trend, resid_mean, resid_std)
+    """
+    n = values.shape[0]
+    fitted = np.empty(n, dtype=np.float64)
+    residuals = np.empty(n, dtype=np.float64)
+    one_minus_alpha = 1.0 - alpha
+    one_minus_beta = 1.0 - beta
+
+    level = values[0]
+    trend = values[1] - values[0]
+    fitted[0] = level
+    residuals[0] = values[0] - level
+    resid_mean = residuals[0]
+    resid_m2 = 0.0
+
+    for i in range(1, n):
+        actual = values[i]
+        last_level = level
+        level = alpha * actual + one_minus_alpha * (level + trend)
+        trend = beta * (level - last_level) + one_minus_beta * trend
+
+        prediction = level + trend
+        residual = actual - prediction
+        fitted[i] = prediction
+        residuals[i] = residual
+
+        delta = residual - resid_mean
+        resid_mean += delta / (i + 1)
+        resid_m2 += delta * (residual - resid_mean)
+
+    resid_std = np.sqrt(resid_m2 / n)
+    return fitted, residuals, level, trend, resid_mean, resid_std
+
+
+@njit(cache=True, nogil=True)
+def _holt_batch(V, alpha, beta):
+    """Run _holt_kernel over every row of an (S, T) matrix of equal-length series.
+
+    Deliberately serial: PredictiveOps runs on orchestrator worker threads, and
+    numba's parallel runtime launched from a non-main thread blocks interpreter
+    shutdown. Rows are short, so the compiled loop is already cheap.
+
+    Returns:
+        (level[S], trend[S], last_residual[S], resid_mean[S], resid_std[S])
+    """
+    num_series = V.shape[0]
+    levels = np.empty(num_series, dtype=np.float64)
+    trends = np.empty(num_series, dtype=np.float64)
+    last_residuals = np.empty(num_series, dtype=np.float64)
+    resid_means = np.empty(num_series, dtype=np.float64)
+    resid_stds = np.empty(num_series, dtype=np.float64)
+
+    for r in range(num_series):
+        _, residuals, level, trend, resid_mean, resid_std = _holt_kernel(V[r], alpha, beta)
+        levels[r] = level
+        trends[r] = trend
+        last_residuals[r] = residuals[-1]
+        resid_means[r] = resid_mean
+        resid_stds[r] = resid_std
+
+    return levels, trends, last_residuals, resid_means, resid_stds
 
 
 def holt_linear_forecast(
     values: Sequence[float],
     horizon: int = 12,
-    alpha: float = 0.4,
-    beta: float = 0.2,
+    alpha: float = DEFAULT_ALPHA,
+    beta: float = DEFAULT_BETA,
 ) -> HoltLinearResult:
     """
     Simple Holt's linear trend (ETS without seasonality).
@@ -34,43 +118,23 @@ def holt_linear_forecast(
         alpha: Smoothing for level (0-1).
         beta: Smoothing for trend (0-1).
     """
-    if len(values) == 0:
-        return HoltLinearResult(0.0, 0.0, [], [0.0] * horizon, [])
-    if len(values) == 1:
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[0] == 0:
+        return HoltLinearResult(0.0, 0.0, np.empty(0), np.zeros(horizon), np.empty(0))
+    if values.shape[0] == 1:
         single = float(values[0])
-        return HoltLinearResult(single, 0.0, [single], [single] * horizon, [0.0])
-
-    level = float(values[0])
-    trend = float(values[1] - values[0])
-    fitted: List[float] = []
-    residuals: List[float] = []
+        return HoltLinearResult(single, 0.0, values.copy(), np.full(horizon, single), np.zeros(1))
 
-    for i, actual in enumerate(values):
-        if i == 0:
-            fitted.append(level)
-            residuals.append(actual - level)
-            continue
+    fitted, residuals, level, trend, resid_mean, resid_std = _holt_kernel(values, float(alpha), float(beta))
+    forecast = level + np.arange(1, horizon + 1) * trend
 
-        last_level = level
-        level = alpha * actual + (1 - alpha) * (level + trend)
-        trend = beta * (level - last_level) + (1 - beta) * trend
-
-        prediction = level + trend
-        fitted.append(prediction)
-        residuals.append(actual - prediction)
-
-    forecast = [level + (k + 1) * trend for k in range(horizon)]
+    return HoltLinearResult(
+        float(level), float(trend), fitted, forecast, residuals, float(resid_mean), float(resid_std)
+    )
 
-    return HoltLinearResult(level, trend, fitted, forecast, residuals)
 
-
-def _z_score(latest_residual: float, residuals: Sequence[float]) -> float:
-    """Compute a simple z-score against residuals, guarding against zero std."""
-    if not residuals:
-        return 0.0
-    mean = sum(residuals) / len(residuals)
-    variance = sum((r - mean) ** 2 for r in residuals) / max(len(residuals), 1)
-    std = variance ** 0.5
+def _z_from_stats(latest_residual: float, mean: float, std: float) -> float:
+    """z-score from precomputed residual statistics, guarding against zero std."""
     if std == 0:
         return 0.0
     return abs(latest_residual - mean) / std
@@ -82,60 +146,92 @@ def generate_ets_summary(metric_points: List[Dict], horizon: int = 12, min_point
 
     metric_points items must include: host, metric_name, value, timestamp.
     """
-    # Group by host/metric
-    grouped: Dict[Tuple[str, str], List[Tuple[datetime, float]]] = {}
-    for m in metric_points:
-        host = m.get("host", "unknown")
-        name = m.get("metric_name", "metric")
-        value = float(m.get("value", 0.0))
-        ts = m.get("timestamp")
-        if isinstance(ts, str):
-            try:
-                ts = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            except ValueError:
-                ts = datetime.now()
-        elif not isinstance(ts, datetime):
-            ts = datetime.now()
-
-        key = (host, name)
-        grouped.setdefault(key, []).append((ts, value))
-
-    series_summaries = []
-    anomalies = []
-
-    for (host, name), points in grouped.items():
-        points.sort(key=lambda p: p[0])
-        values = [p[1] for p in points]
-        if len(values) < min_points:
-            continue
-
-        result = holt_linear_forecast(values, horizon=horizon)
-        last_value = values[-1]
-        latest_residual = result.residuals[-1] if result.residuals else 0.0
-        z = _z_score(latest_residual, result.residuals)
-
-        series_summary = {
-            "host": host,
-            "metric": name,
-            "last_value": round(last_value, 2),
-            "trend": round(result.trend, 4),
-            "forecast": [round(v, 2) for v in result.forecast[: min(horizon, 8)]],
-            "anomaly_score": round(z, 3),
-        }
-        series_summaries.append(series_summary)
-
-        anomalies.append({
-            "host": host,
-            "metric": name,
-            "z_score": round(z, 3),
-            "residual": round(latest_residual, 3),
-            "trend": round(result.trend, 4),
-        })
-
+    # One clock read per summary, shared by the timestamp fallback and generated_at
+    now = datetime.now(timezone.utc)
+
+    series_values: Dict[Tuple[str, str], np.ndarray] = {}
+    buckets: Dict[int, List[Tuple[str, str]]] = {}
+
+    if metric_points:
+        frame = pd.DataFrame(metric_points, columns=["host", "metric_name", "value", "timestamp"])
+        frame["host"] = frame["host"].fillna("unknown")
+        frame["metric_name"] = frame["metric_name"].fillna("metric")
+        values = frame["value"].fillna(0.0).to_numpy(dtype=np.float64)
+
+        # One vectorized parse for the whole column; repeated strings hit pandas' cache.
+        # Unparseable timestamps sort last, as if they had just arrived.
+        ts = pd.to_datetime(frame["timestamp"], utc=True, errors="coerce", cache=True, format="ISO8601")
+        ts = ts.fillna(pd.Timestamp(now)).to_numpy()
+
+        # Group codes follow first appearance so series keep their input order
+        codes = frame.groupby(["host", "metric_name"], sort=False).ngroup().to_numpy()
+        order = np.lexsort((ts, codes))
+        codes = codes[order]
+        values = values[order]
+        hosts = frame["host"].to_numpy()[order]
+        names = frame["metric_name"].to_numpy()[order]
+
+        # Bucket series by length so equal-length series share one batched kernel call
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        ends = np.r_[starts[1:], len(codes)]
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if end - start < min_points:
+                continue
+            key = (hosts[start], names[start])
+            series_values[key] = values[start:end]
+            buckets.setdefault(end - start, []).append(key)
+
+    steps = np.arange(1, min(horizon, 8) + 1)
+    summaries: Dict[Tuple[str, str], Dict] = {}
+    anomaly_rows: Dict[Tuple[str, str], Dict] = {}
+
+    for length, keys in buckets.items():
+        V = np.stack([series_values[key] for key in keys])
+        if length < 2:
+            # A single point has no trend; it is its own level and forecast
+            levels = V[:, 0]
+            trends = last_residuals = resid_means = resid_stds = np.zeros(len(keys))
+        else:
+            levels, trends, last_residuals, resid_means, resid_stds = _holt_batch(V, DEFAULT_ALPHA, DEFAULT_BETA)
+        z_scores = np.where(
+            resid_stds == 0,
+            0.0,
+            np.abs(last_residuals - resid_means) / np.where(resid_stds == 0, 1.0, resid_stds),
+        )
+        forecasts = levels[:, None] + steps[None, :] * trends[:, None]
+
+        # Round whole columns at once and convert to Python floats in bulk
+        last_values_r = np.round(V[:, -1], 2).tolist()
+        trends_r = np.round(trends, 4).tolist()
+        z_scores_r = np.round(z_scores, 3).tolist()
+        residuals_r = np.round(last_residuals, 3).tolist()
+        forecasts_r = np.round(forecasts, 2).tolist()
+
+        for row, key in enumerate(keys):
+            host, name = key
+            summaries[key] = {
+                "host": host,
+                "metric": name,
+                "last_value": last_values_r[row],
+                "trend": trends_r[row],
+                "forecast": forecasts_r[row],
+                "anomaly_score": z_scores_r[row],
+            }
+            anomaly_rows[key] = {
+                "host": host,
+                "metric": name,
+                "z_score": z_scores_r[row],
+                "residual": residuals_r[row],
+                "trend": trends_r[row],
+            }
+
+    # Emit series in input order rather than bucket order
+    series_summaries = [summaries[key] for key in series_values]
+    anomalies = [anomaly_rows[key] for key in series_values]
     anomalies.sort(key=lambda a: a["z_score"], reverse=True)
 
     return {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": now.isoformat(),
         "horizon": horizon,
         "series": series_summaries,
         "top_anomalies": anomalies[:5],
@@ -1,5 +1,25 @@
 from agents.orchestrator import enhanced_orchestrator
 from config.action_executor import executor
+import copy
+import re
+
+# Synthesis keyword -> action rule. Rules are emitted in this order, once each.
+ACTION_RULES = [
+    ("suppress_alerts", ("suppress", "correlation"), {
+        "type": "suppress_alerts",
+        "params": {"alert_ids": ["example"]},
+        "risk_level": "LOW"
+    }),
+    ("restart_service", ("restart",), {
+        "type": "restart_service",
+        "params": {"host": "web-01", "service": "nginx"},
+        "risk_level": "MEDIUM"
+    }),
+]
+
+_KEYWORD_TO_RULE = {kw: rule_id for rule_id, keywords, _ in ACTION_RULES for kw in keywords}
+# Single case-insensitive alternation scanned once over the synthesis text
+_ACTION_KEYWORD_RE = re.compile("|".join(re.escape(kw) for kw in _KEYWORD_TO_RULE), re.IGNORECASE)
 
 def execute_incident_response(alerts, metrics=None, auto_execute=True):
     """Full incident response with action execution"""
@@ -25,21 +45,10 @@ def execute_incident_response(alerts, metrics=None, auto_execute=True):
 
 def parse_actions_from_synthesis(synthesis: str) -> list:
     """Parse recommended actions from agent output"""
-    synthesis = synthesis.lower()
-    actions = []
-    
-    if "suppress" in synthesis or "correlation" in synthesis:
-        actions.append({
-            "type": "suppress_alerts",
-            "params": {"alert_ids": ["example"]},
-            "risk_level": "LOW"
-        })
-    
-    if "restart" in synthesis:
-        actions.append({
-            "type": "restart_service",
-            "params": {"host": "web-01", "service": "nginx"},
-            "risk_level": "MEDIUM"
-        })
-    
-    return actions
\ No newline at end of file
+    hits = set()
+    for match in _ACTION_KEYWORD_RE.finditer(synthesis):
+        hits.add(_KEYWORD_TO_RULE[match.group(0).lower()])
+        if len(hits) == len(ACTION_RULES):
+            break
+
+    return [copy.deepcopy(action) for rule_id, _, action in ACTION_RULES if rule_id in hits]
\ No newline at end of file
@@ -1,13 +1,24 @@
-from config.bedrock_client import BedrockClient
+from config.bedrock_client import get_client
 from config.perception import AgentPerception
 from config.learning import AgentLearning
 from config.knowledge_base import kb
+from config import kb_cache
 from config.terminal_logger import terminal_logger
 from config.agent_selector import agent_selector
+from agents.alert_ops import analyze_alert_stream_with_memory
+from agents.predictive_ops import analyze_metrics
+from agents.strands_tools import correlate_alerts
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+import hashlib
+import orjson
 import os
+import re
+import reprlib
+import threading
+import time
 import uuid
 
-client = BedrockClient(region_name=os.getenv("AWS_REGION", "us-east-1"))
+client = get_client()
 
 ORCHESTRATOR_SYSTEM_PROMPT = """You are the Orchestrator with perception, memory, and learning.
 
@@ -26,12 +37,150 @@ Agents:
 
 Always reference learned patterns and adjust confidence based on past outcomes."""
 
+# Synthesis prompt, filled with a single format_map call per incident
+_SYNTHESIS_PROMPT_TMPL = (
+    "Synthesize unified response:\n\n"
+    "Alert Analysis: {alert}\n"
+    "Prediction: {pred}\n"
+    "ETS Forecasts: {ets}\n"
+    "Learned Patterns: {lp} successful patterns in KB\n"
+)
+
+MODEL_ID = os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514")
+
+# Longest the orchestrator waits on agent selection, and on all specialist agents together,
+# before continuing without them
+AGENT_TIMEOUT_SECONDS = float(os.getenv("AGENT_TIMEOUT_SECONDS", "60"))
+
+# Recurring incident shapes reuse their learned synthesis above this confidence
+SYNTHESIS_TEMPLATE_MIN_CONFIDENCE = float(os.getenv("SYNTHESIS_TEMPLATE_MIN_CONFIDENCE", "0.9"))
+# A learned synthesis is reused at most this many times before the model is asked again
+SYNTHESIS_TEMPLATE_MAX_REUSES = int(os.getenv("SYNTHESIS_TEMPLATE_MAX_REUSES", "10"))
+
+# "Risk Level: HIGH", "risk: medium", ... in a model synthesis
+_RISK_LEVEL_RE = re.compile(r"(risk(?: level)?\W{1,3})(critical|high|medium|low)\b", re.IGNORECASE)
+
+
+def _as_text(value) -> str:
+    """Return value unchanged if it is already a str, otherwise its str() form"""
+    return value if isinstance(value, str) else str(value)
+
+
+# Bounded repr for prompt snippets: large nested payloads are abbreviated while being
+# rendered instead of being fully stringified and then sliced
+_SHORT_REPR = reprlib.Repr()
+_SHORT_REPR.maxlevel = 4
+_SHORT_REPR.maxdict = _SHORT_REPR.maxlist = _SHORT_REPR.maxtuple = 20
+_SHORT_REPR.maxstring = 600
+_SHORT_REPR.maxother = 200
+
+
+def _short(value, n: int) -> str:
+    """First n characters of value's text form, bounding the work for non-str values"""
+    if isinstance(value, str):
+        return value[:n]
+    return _SHORT_REPR.repr(value)[:n]
+
+
+def _incident_signature(alert_dicts, prediction) -> str:
+    """Stable key for an incident's shape: hosts, alert title words and predicted risk"""
+    hosts = sorted({str(a["host"]) for a in alert_dicts})
+    words = sorted({w for a in alert_dicts for w in a["title"].lower().split()})
+    risk = prediction.get("risk_level") if isinstance(prediction, dict) else None
+    payload = "|".join([",".join(hosts), ",".join(words), str(risk)])
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _synthesis_values(ctx) -> dict:
+    """The current incident's fields a learned synthesis template is filled with"""
+    hosts = sorted({str(a["host"]) for a in ctx["alert_details"]})
+    prediction = ctx["prediction"]
+    risk = prediction.get("risk_level") if isinstance(prediction, dict) else None
+    values = {f"host_{i}": host for i, host in enumerate(hosts)}
+    values.update(hosts=", ".join(hosts), alert_count=len(ctx["alert_details"]), risk_level=risk or "unknown")
+    return values
+
+
+def _to_synthesis_template(text: str, values: dict) -> str:
+    """Turn one incident's synthesis into a str.format template over _synthesis_values fields
+
+    Hosts, the alert count and the risk level of the incident the text was written
+    for become placeholders, so a reuse reports the new incident's values.
+    """
+    template = text.replace("{", "{{").replace("}", "}}")
+    host_keys = sorted((k for k in values if k.startswith("host_")), key=lambda k: -len(values[k]))
+    for key in host_keys:
+        template = re.sub(rf"(?<![\w.-]){re.escape(values[key])}(?![\w-])", "{" + key + "}", template)
+    template = re.sub(rf"\b{values['alert_count']}(\s+(?:\w+\s+)?alerts?)\b", r"{alert_count}\1",
+                      template, flags=re.IGNORECASE)
+    if values["risk_level"] != "unknown":
+        template = _RISK_LEVEL_RE.sub(lambda m: m.group(1) + "{risk_level}", template)
+    return template
+
+
+def _input_hash(ids) -> str:
+    """Order-independent hash of alert or metric IDs"""
+    return hashlib.blake2b(b"\0".join(sorted(i.encode("utf-8") for i in ids)), digest_size=16).hexdigest()
+
+
+class _IncidentWrites:
+    """Timeline events and actions for one incident, flushed to the KB in one batch
+
+    Specialist agents queue writes from worker threads. Once flushed the buffer is
+    closed: writes from an agent that outlived its timeout are logged and dropped
+    instead of vanishing into a list nobody reads.
+    """
+
+    def __init__(self, incident_id):
+        self.incident_id = incident_id
+        self.timeline = []
+        self.actions = []
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def event(self, event):
+        """Queue a timeline event, stamped now (no-op without an incident ID)"""
+        self._queue(self.timeline, event, "timeline event")
+
+    def action(self, action):
+        """Queue an incident action, stamped now (no-op without an incident ID)"""
+        self._queue(self.actions, action, "action")
+
+    def _queue(self, target, record, kind):
+        if not self.incident_id:
+            return
+        with self._lock:
+            if not self.closed:
+                record['timestamp'] = int(time.time())
+                target.append(record)
+                return
+        terminal_logger.add_log(
+            f"Dropped late {kind} from {record.get('agent', 'unknown agent')} - "
+            f"incident {self.incident_id} was already written",
+            "WARNING"
+        )
+
+    def flush(self):
+        """Write all queued events and actions with one KB call each, then close the buffer"""
+        with self._lock:
+            self.closed = True
+            timeline, self.timeline = self.timeline, []
+            actions, self.actions = self.actions, []
+        if self.incident_id:
+            if timeline:
+                kb.add_timeline_events_bulk(self.incident_id, timeline)
+            if actions:
+                kb.add_incident_actions_bulk(self.incident_id, actions)
+
 
 class EnhancedOrchestrator:
     def __init__(self):
         self.perception = AgentPerception("Orchestrator")
         self.learning = AgentLearning()
         self.audit_log = []
+        # Shared worker pool for the local perception and KB reads of each incident; Bedrock-bound
+        # work (selection, specialist agents) runs on a per-incident executor instead
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="orchestrator")
 
     def handle_incident_full(self, alerts, metrics=None, incident_id=None):
         """Full pipeline: Perceive → Reason → Act → Learn
@@ -41,24 +190,92 @@ class EnhancedOrchestrator:
             metrics: Optional list of metric objects
             incident_id: Optional incident ID for linking
         """
-
-        # PHASE B: Intelligent agent selection based on incident content
-        # Convert alerts to dict format for selector
-        alert_dicts = [
-            {"alert_id": a.alert_id, "title": a.title, "description": getattr(a, 'description', ''),
-             "host": a.host, "severity": a.severity.value}
-            for a in alerts
-        ]
+        # Timeline events and actions are buffered per incident and written in one batch,
+        # including when the pipeline fails part-way
+        writes = _IncidentWrites(incident_id)
+        try:
+            ctx = self._analyze_incident(alerts, metrics, incident_id, writes)
+            if ctx["alert_analysis"] is None and ctx["prediction"] is None:
+                synthesis = self._degraded_synthesis(ctx)
+            else:
+                synthesis = self._learned_synthesis(ctx)
+                if synthesis is None:
+                    synthesis = self._synthesize(ctx["alert_analysis"], ctx["prediction"], ctx["learned"])
+                    kb.store_synthesis_template(
+                        ctx["signature"], _to_synthesis_template(_as_text(synthesis), _synthesis_values(ctx))
+                    )
+            return self._complete_incident(ctx, synthesis, writes)
+        finally:
+            writes.flush()
+
+    def _analyze_incident(self, alerts, metrics, incident_id, writes):
+        """Perception, selection and specialist analysis; returns the context synthesis needs"""
+        # Selection and the specialists block on Bedrock. They get their own executor so an
+        # agent that outlives its timeout holds one of this incident's threads, never a
+        # worker of the shared pool; shutdown does not wait for such stragglers
+        bedrock_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="orchestrator-incident")
+        try:
+            return self._analyze_with(bedrock_pool, alerts, metrics, incident_id, writes)
+        finally:
+            bedrock_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _analyze_with(self, bedrock_pool, alerts, metrics, incident_id, writes):
+
+        # Convert alerts to dicts once; selection, perception and storage all read from these
+        alert_dicts = []
+        alert_details = []
+        for a in alerts:
+            timestamp_iso = a.timestamp.isoformat() if hasattr(a.timestamp, 'isoformat') else str(a.timestamp)
+            alert_dicts.append({
+                "alert_id": a.alert_id, "title": a.title, "description": getattr(a, 'description', ''),
+                "host": a.host, "severity": a.severity.value, "timestamp": a.timestamp
+            })
+            # Full alert details for storage
+            alert_details.append({
+                "alert_id": a.alert_id, "title": a.title, "host": a.host,
+                "severity": a.severity.value, "timestamp": timestamp_iso
+            })
 
         metric_dicts = None
         if metrics:
             metric_dicts = [
-                {"host": m.host, "metric_name": m.metric_name, "value": m.value}
+                {"host": m.host, "metric_name": m.metric_name,
+                 "value": m.value, "timestamp": m.timestamp}
                 for m in metrics
             ]
 
+        # Selection, perception and the KB pattern read are independent of each other,
+        # so they are fanned out together and joined at first use
+        # PHASE B: Intelligent agent selection based on incident content
+        selection_future = bedrock_pool.submit(
+            agent_selector.select_agents_with_keywords, alert_dicts, metric_dicts, 60
+        )
+
+        # PERCEPTION
+        # NARRATIVE: Perception phase
+        terminal_logger.add_log(
+            f"Perception phase: Analyzing {len(alerts)} alerts" + (f" and {len(metrics)} metrics" if metrics else ""),
+            "PERCEPTION"
+        )
+        alert_perception_future = self._pool.submit(self.perception.perceive_alerts, alert_dicts)
+        metric_perception_future = (
+            self._pool.submit(self.perception.perceive_metrics, metric_dicts) if metric_dicts else None
+        )
+
+        # KNOWLEDGE
+        learned_future = self._pool.submit(kb_cache.get_learned_patterns, "Orchestrator", "correlation")
+
         # Let AgentSelector intelligently choose relevant agents
-        agents_involved = agent_selector.select_agents(alert_dicts, metric_dicts, threshold=60)
+        try:
+            agents_involved, selection_keywords = selection_future.result(timeout=AGENT_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            terminal_logger.add_log(
+                f"Agent selection did not respond within {AGENT_TIMEOUT_SECONDS:g}s - using keyword selection",
+                "ORCHESTRATOR"
+            )
+            agents_involved, selection_keywords = agent_selector.select_agents_with_keywords(
+                alert_dicts, metric_dicts, 60, use_llm=False
+            )
 
         # NARRATIVE: Agent selection
         terminal_logger.add_log(
@@ -69,130 +286,59 @@ class EnhancedOrchestrator:
         # PHASE 1: Update processing state to 'analyzing'
         if incident_id:
             kb.update_incident_processing_state(incident_id, 'analyzing')
-            kb.add_timeline_event(incident_id, {
-                'agent': 'Orchestrator',
-                'event': 'Started analysis',
-                'details': {'alerts_count': len(alerts)}
-            })
-
-        # PERCEPTION
-        # NARRATIVE: Perception phase
-        terminal_logger.add_log(
-            f"Perception phase: Analyzing {len(alerts)} alerts" + (f" and {len(metrics)} metrics" if metrics else ""),
-            "PERCEPTION"
-        )
-
-        alert_perception = self.perception.perceive_alerts([
-            {"alert_id": a.alert_id, "title": a.title, "host": a.host,
-             "timestamp": a.timestamp, "severity": a.severity.value}
-            for a in alerts
-        ])
-
-        metric_perception = None
-        if metrics:
-            metric_perception = self.perception.perceive_metrics([
-                {"host": m.host, "metric_name": m.metric_name,
-                 "value": m.value, "timestamp": m.timestamp}
-                for m in metrics
-            ])
+        writes.event({
+            'agent': 'Orchestrator',
+            'event': 'Started analysis',
+            'details': {'alerts_count': len(alerts)}
+        })
 
-        # KNOWLEDGE
-        learned = self.learning.get_learned_patterns("Orchestrator", "correlation")
+        alert_perception = alert_perception_future.result()
+        metric_perception = metric_perception_future.result() if metric_perception_future else None
+        learned = learned_future.result()
 
         # REASONING (delegate to selected specialist agents only)
-        from agents.alert_ops import analyze_alert_stream_with_memory
-        from agents.predictive_ops import analyze_metrics
-
         alert_analysis = None
         prediction = None
 
-        # AlertOps: Always called if selected (correlation baseline)
-        if "AlertOps" in agents_involved:
-            try:
-                if incident_id:
-                    kb.add_timeline_event(incident_id, {
-                        'agent': 'AlertOps',
-                        'event': 'Correlating and analyzing alerts',
-                        'details': {'alerts_count': len(alerts)}
-                    })
-
-                terminal_logger.add_log(
-                    f"AlertOps analyzing {len(alerts)} alerts for correlation patterns",
-                    "ALERTOPS"
-                )
-
-                alert_analysis = analyze_alert_stream_with_memory(alerts)
-
-                terminal_logger.add_log(
-                    "AlertOps completed correlation analysis",
-                    "ALERTOPS"
-                )
-
-                # Track action for agent status display
-                if incident_id:
-                    kb.add_incident_action(incident_id, {
-                        'type': 'alert_correlation',
-                        'agent': 'AlertOps',
-                        'description': f'Correlated {len(alerts)} alerts',
-                        'status': 'completed'
-                    })
-            except Exception as e:
-                terminal_logger.add_log(
-                    f"AlertOps failed: {str(e)} - continuing with degraded analysis",
-                    "ALERTOPS"
-                )
-                if incident_id:
-                    kb.add_timeline_event(incident_id, {
-                        'agent': 'AlertOps',
-                        'event': 'Agent invocation failed - continuing with other agents',
-                        'details': {'error': str(e)}
-                    })
-                # Don't mark as failed or re-raise - continue with other agents
-                alert_analysis = None  # Set to None to indicate failure
-
-        # PredictiveOps: Only if selected AND metrics available
-        if "PredictiveOps" in agents_involved and metrics:
-            try:
-                if incident_id:
-                    kb.add_timeline_event(incident_id, {
-                        'agent': 'PredictiveOps',
-                        'event': 'Performing predictive analysis on metrics',
-                        'details': {'metrics_count': len(metrics)}
-                    })
-
-                terminal_logger.add_log(
-                    f"PredictiveOps analyzing {len(metrics)} metrics for trend forecasting",
-                    "PREDICTIVEOPS"
-                )
-
-                prediction = analyze_metrics(metrics)
-
-                terminal_logger.add_log(
-                    "PredictiveOps completed predictive analysis",
-                    "PREDICTIVEOPS"
-                )
-
-                # Track action for agent status display
-                if incident_id:
-                    kb.add_incident_action(incident_id, {
-                        'type': 'predictive_analysis',
-                        'agent': 'PredictiveOps',
-                        'description': f'Analyzed {len(metrics)} metrics for trends',
-                        'status': 'completed'
-                    })
-            except Exception as e:
-                terminal_logger.add_log(
-                    f"PredictiveOps failed: {str(e)} - continuing with degraded analysis",
-                    "PREDICTIVEOPS"
-                )
-                if incident_id:
-                    kb.add_timeline_event(incident_id, {
-                        'agent': 'PredictiveOps',
-                        'event': 'Agent invocation failed - continuing with other agents',
-                        'details': {'error': str(e)}
-                    })
-                # Don't mark as failed or re-raise - continue with other agents
-                prediction = None  # Set to None to indicate failure
+        # AlertOps and PredictiveOps are independent until synthesis, so their
+        # Bedrock round-trips run concurrently instead of back to back
+        run_alert_ops = "AlertOps" in agents_involved  # Always called if selected (correlation baseline)
+        run_predictive_ops = "PredictiveOps" in agents_involved and bool(metrics)  # Only if metrics available
+
+        # Re-runs of an incident whose alerts and metrics are unchanged reuse the stored
+        # specialist outputs; only synthesis sees the fresh learned patterns
+        input_hashes = {
+            "alerts": _input_hash(a.alert_id for a in alerts),
+            "metrics": _input_hash(m.metric_id for m in metrics) if metrics else None
+        }
+        prior_outputs = {}
+        if incident_id:
+            prior = kb.get_incident(incident_id)
+            if prior and prior.get("input_hashes") == input_hashes:
+                prior_outputs = prior.get("agent_outputs") or {}
+        if run_alert_ops and prior_outputs.get("alert_analysis") is not None:
+            alert_analysis = prior_outputs["alert_analysis"]
+            run_alert_ops = False
+        if run_predictive_ops and prior_outputs.get("prediction") is not None:
+            prediction = prior_outputs["prediction"]
+            run_predictive_ops = False
+        if prior_outputs:
+            terminal_logger.add_log(
+                "Orchestrator reusing prior specialist analysis - incident inputs unchanged",
+                "ORCHESTRATOR"
+            )
+
+        specialists = {}
+        if run_alert_ops:
+            specialists[bedrock_pool.submit(self._run_alert_ops, alerts, writes)] = ("AlertOps", "ALERTOPS")
+        if run_predictive_ops:
+            specialists[bedrock_pool.submit(self._run_predictive_ops, metrics, writes)] = ("PredictiveOps", "PREDICTIVEOPS")
+
+        results = self._agent_results(specialists, writes)
+        if run_alert_ops:
+            alert_analysis = results["AlertOps"]
+        if run_predictive_ops:
+            prediction = results["PredictiveOps"]
 
         # Track PatchOps and TaskOps if selected (even if not explicitly invoked)
         if "PatchOps" in agents_involved and incident_id:
@@ -200,7 +346,7 @@ class EnhancedOrchestrator:
                 "PatchOps evaluating patch requirements",
                 "PATCHOPS"
             )
-            kb.add_incident_action(incident_id, {
+            writes.action({
                 'type': 'patch_evaluation',
                 'agent': 'PatchOps',
                 'description': 'Evaluated patch requirements for incident',
@@ -212,7 +358,7 @@ class EnhancedOrchestrator:
                 "TaskOps assessing automation opportunities",
                 "TASKOPS"
             )
-            kb.add_incident_action(incident_id, {
+            writes.action({
                 'type': 'automation_assessment',
                 'agent': 'TaskOps',
                 'description': 'Assessed automation opportunities',
@@ -226,7 +372,70 @@ class EnhancedOrchestrator:
             "SYNTHESIS"
         )
 
-        synthesis = self._synthesize(alert_analysis, prediction, learned)
+        return {
+            "incident_id": incident_id,
+            "alert_details": alert_details,
+            "agents_involved": agents_involved,
+            "selection_keywords": selection_keywords,
+            "alert_perception": alert_perception,
+            "learned": learned,
+            "alert_analysis": alert_analysis,
+            "prediction": prediction,
+            "signature": _incident_signature(alert_dicts, prediction),
+            "input_hashes": input_hashes,
+        }
+
+    def _learned_synthesis(self, ctx):
+        """Fill the learned synthesis template for a recurring incident shape, or None to call the model
+
+        Every SYNTHESIS_TEMPLATE_MAX_REUSES reuses the model is called again, and its
+        answer replaces the template.
+        """
+        template = kb.get_synthesis_template(ctx["signature"])
+        if not template or template["confidence"] <= SYNTHESIS_TEMPLATE_MIN_CONFIDENCE:
+            return None
+
+        if template.get("uses", 0) >= SYNTHESIS_TEMPLATE_MAX_REUSES:
+            terminal_logger.add_log(
+                f"Orchestrator refreshing learned synthesis after {template['uses']} reuses - calling model",
+                "LEARNING"
+            )
+            return None
+
+        values = _synthesis_values(ctx)
+        try:
+            body = template["template"].format_map(values)
+        except (KeyError, IndexError, ValueError):
+            return None
+        kb.record_synthesis_template_use(ctx["signature"])
+
+        terminal_logger.add_log(
+            f"Orchestrator reusing learned synthesis ({template['samples']} matching incidents, "
+            f"confidence {template['confidence']:.2f}) - skipping model call",
+            "LEARNING"
+        )
+        return (
+            f"Learned response for {values['alert_count']} alerts on {values['hosts']} "
+            f"(matched {template['samples']} past incidents, confidence {template['confidence']:.2f}):\n{body}"
+        )
+
+    def _degraded_synthesis(self, ctx):
+        """Template synthesis used when no specialist output exists - skips the Bedrock round-trip"""
+        return (
+            f"Degraded synthesis: no agent analysis available for incident {ctx['incident_id'] or 'unlinked'}. "
+            f"{ctx['learned']['successful_patterns']} learned patterns in KB."
+        )
+
+    def _complete_incident(self, ctx, synthesis, writes):
+        """Store the synthesis, mark the incident resolved and record the selection outcome"""
+        incident_id = ctx["incident_id"]
+        agents_involved = ctx["agents_involved"]
+        alert_details = ctx["alert_details"]
+        alert_perception = ctx["alert_perception"]
+        learned = ctx["learned"]
+
+        # Normalize once; storage and the decision log reuse the same string
+        synthesis_text = _as_text(synthesis)
 
         # NARRATIVE: Root cause identified
         terminal_logger.add_log(
@@ -235,62 +444,62 @@ class EnhancedOrchestrator:
         )
 
         # Track Orchestrator action for agent status display
-        if incident_id:
-            kb.add_incident_action(incident_id, {
-                'type': 'synthesis',
-                'agent': 'Orchestrator',
-                'description': f'Synthesized findings from {len(agents_involved)} agents',
-                'status': 'completed'
-            })
+        writes.action({
+            'type': 'synthesis',
+            'agent': 'Orchestrator',
+            'description': f'Synthesized findings from {len(agents_involved)} agents',
+            'status': 'completed'
+        })
 
-        # Prepare full alert details for storage
-        alert_details = [
-            {
-                "alert_id": a.alert_id,
-                "title": a.title,
-                "host": a.host,
-                "severity": a.severity.value,
-                "timestamp": a.timestamp.isoformat() if hasattr(a.timestamp, 'isoformat') else str(a.timestamp)
-            }
-            for a in alerts
-        ]
+        agent_outputs = {"alert_analysis": ctx["alert_analysis"], "prediction": ctx["prediction"]}
+
+        # Correlation confidence is persisted so the incident detail view never recomputes it
+        correlation_score = correlate_alerts(alert_details).get("confidence") if alert_details else None
 
         # LEARN: Store for future reference
         # Update incident with analysis results and all agents that participated
         incident_data = {
             "incident_id": incident_id or str(uuid.uuid4()),
             "alerts": alert_details,
-            "root_cause": str(synthesis),  # FIX: Store full synthesis, don't truncate
+            "root_cause": synthesis_text,  # FIX: Store full synthesis, don't truncate
             "outcome": "pending",
-            "agents_involved": agents_involved  # All 5 agents analyzed this incident
+            "agents_involved": agents_involved,  # All 5 agents analyzed this incident
+            "input_hashes": ctx["input_hashes"],
+            "agent_outputs": agent_outputs,
+            "correlation_score": correlation_score,
+            "confidence": correlation_score
         }
 
         if not incident_id:
             incident_id = kb.store_incident(incident_data)
+            writes.incident_id = incident_id
         else:
             # Update existing incident with agents_involved
             existing = kb.get_incident(incident_id)
             if existing:
                 existing['agents_involved'] = agents_involved
-                existing['root_cause'] = str(synthesis)  # FIX: Store full synthesis
+                existing['root_cause'] = synthesis_text  # FIX: Store full synthesis
+                existing['input_hashes'] = ctx["input_hashes"]
+                existing['agent_outputs'] = agent_outputs
+                existing['correlation_score'] = correlation_score
+                existing['confidence'] = correlation_score
                 kb.incident_memory[incident_id] = existing
 
         # PHASE 1 TASK 1.2: Mark processing as complete
         if incident_id:
             kb.update_incident_processing_state(incident_id, 'resolved')
-            kb.add_timeline_event(incident_id, {
-                'agent': 'Orchestrator',
-                'event': 'Processing complete',
-                'details': {'status': 'resolved', 'agents_count': len(agents_involved)}
-            })
+        writes.event({
+            'agent': 'Orchestrator',
+            'event': 'Processing complete',
+            'details': {'status': 'resolved', 'agents_count': len(agents_involved)}
+        })
 
         # PHASE C: Record agent selection for learning
-        keywords = agent_selector._extract_keywords(alert_dicts)
         outcome_quality = 0.8  # Default good outcome (can be enhanced with actual success metrics)
-        kb.record_agent_selection(keywords, agents_involved, outcome_quality)
+        kb.record_agent_selection(ctx["selection_keywords"], agents_involved, outcome_quality)
 
         # MEMORY
-        self._log_decision(incident_id, synthesis)
+        self._log_decision(incident_id, synthesis_text)
 
         return {
             "incident_id": incident_id,
@@ -299,57 +508,174 @@ class EnhancedOrchestrator:
             "synthesis": synthesis
         }
 
+    def _agent_results(self, futures, writes):
+        """Wait for all specialists under one AGENT_TIMEOUT_SECONDS deadline
+
+        Args:
+            futures: Dict of future -> (agent name, log type)
+
+        Returns:
+            Dict of agent name -> result, None for agents still running at the deadline (degraded analysis)
+        """
+        if not futures:
+            return {}
+        done, _ = wait(futures, timeout=AGENT_TIMEOUT_SECONDS)
+        results = {}
+        for future, (agent, log_type) in futures.items():
+            if future in done:
+                results[agent] = future.result()
+                continue
+            future.cancel()
+            terminal_logger.add_log(
+                f"{agent} did not respond within {AGENT_TIMEOUT_SECONDS:g}s - continuing with degraded analysis",
+                log_type
+            )
+            writes.event({
+                'agent': agent,
+                'event': 'Agent invocation timed out - continuing with other agents',
+                'details': {'timeout_seconds': AGENT_TIMEOUT_SECONDS}
+            })
+            results[agent] = None
+        return results
+
+    def _run_alert_ops(self, alerts, writes):
+        """Run AlertOps correlation, returning None on failure (degraded analysis)"""
+        try:
+            writes.event({
+                'agent': 'AlertOps',
+                'event': 'Correlating and analyzing alerts',
+                'details': {'alerts_count': len(alerts)}
+            })
+
+            terminal_logger.add_log(
+                f"AlertOps analyzing {len(alerts)} alerts for correlation patterns",
+                "ALERTOPS"
+            )
+
+            alert_analysis = analyze_alert_stream_with_memory(alerts)
+
+            terminal_logger.add_log(
+                "AlertOps completed correlation analysis",
+                "ALERTOPS"
+            )
+
+            # Track action for agent status display
+            writes.action({
+                'type': 'alert_correlation',
+                'agent': 'AlertOps',
+                'description': f'Correlated {len(alerts)} alerts',
+                'status': 'completed'
+            })
+            return alert_analysis
+        except Exception as e:
+            terminal_logger.add_log(
+                f"AlertOps failed: {str(e)} - continuing with degraded analysis",
+                "ALERTOPS"
+            )
+            writes.event({
+                'agent': 'AlertOps',
+                'event': 'Agent invocation failed - continuing with other agents',
+                'details': {'error': str(e)}
+            })
+            # Don't mark as failed or re-raise - continue with other agents
+            return None
+
+    def _run_predictive_ops(self, metrics, writes):
+        """Run PredictiveOps forecasting, returning None on failure (degraded analysis)"""
+        try:
+            writes.event({
+                'agent': 'PredictiveOps',
+                'event': 'Performing predictive analysis on metrics',
+                'details': {'metrics_count': len(metrics)}
+            })
+
+            terminal_logger.add_log(
+                f"PredictiveOps analyzing {len(metrics)} metrics for trend forecasting",
+                "PREDICTIVEOPS"
+            )
+
+            prediction = analyze_metrics(metrics)
+
+            terminal_logger.add_log(
+                "PredictiveOps completed predictive analysis",
+                "PREDICTIVEOPS"
+            )
+
+            # Track action for agent status display
+            writes.action({
+                'type': 'predictive_analysis',
+                'agent': 'PredictiveOps',
+                'description': f'Analyzed {len(metrics)} metrics for trends',
+                'status': 'completed'
+            })
+            return prediction
+        except Exception as e:
+            terminal_logger.add_log(
+                f"PredictiveOps failed: {str(e)} - continuing with degraded analysis",
+                "PREDICTIVEOPS"
+            )
+            writes.event({
+                'agent': 'PredictiveOps',
+                'event': 'Agent invocation failed - continuing with other agents',
+                'details': {'error': str(e)}
+            })
+            # Don't mark as failed or re-raise - continue with other agents
+            return None
+
     def _synthesize(self, alert_analysis, prediction, learned):
         """Synthesize findings using Anthropic SDK"""
-        import json
+        prompt = _SYNTHESIS_PROMPT_TMPL.format_map(
+            self._synthesis_fields(alert_analysis, prediction, learned)
+        )
 
+        # Call Bedrock API
+        response = client.messages.create(
+            model=MODEL_ID,
+            max_tokens=2048,
+            system=ORCHESTRATOR_SYSTEM_PROMPT,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+
+        return response.content[0].text
+
+    def _synthesis_fields(self, alert_analysis, prediction, learned):
+        """Normalize one incident's analysis into the synthesis template fields"""
         # Normalize alert analysis
-        alert_str = str(alert_analysis)[:300] if alert_analysis else 'Alert analysis unavailable - agent failed'
+        alert_str = _short(alert_analysis, 300) if alert_analysis else 'Alert analysis unavailable - agent failed'
 
         # Normalize prediction + optional ETS block
         prediction_summary = 'N/A'
         ets_block = None
         if isinstance(prediction, dict):
-            prediction_summary = (prediction.get("text") or prediction.get("summary") or str(prediction))[:500]
+            prediction_summary = _short(prediction.get("text") or prediction.get("summary") or prediction, 500)
             ets_block = prediction.get("ets")
         elif prediction:
-            prediction_summary = str(prediction)[:500]
+            prediction_summary = _short(prediction, 500)
 
         ets_snippet = ""
         if ets_block and ets_block.get("series"):
             try:
-                ets_snippet = json.dumps({
+                ets_snippet = orjson.dumps({
                     "series": ets_block.get("series", [])[:2],
                     "top_anomalies": ets_block.get("top_anomalies", [])[:3],
                     "horizon": ets_block.get("horizon")
-                })[:600]
+                }, option=orjson.OPT_SORT_KEYS).decode()[:600]
             except Exception:
-                ets_snippet = str(ets_block)[:400]
-
-        context = f"""
-Alert Analysis: {alert_str}
-Prediction: {prediction_summary}
-ETS Forecasts: {ets_snippet or 'none'}
-Learned Patterns: {learned['successful_patterns']} successful patterns in KB
-"""
-        prompt = f"Synthesize unified response:\n{context}"
+                ets_snippet = _short(ets_block, 400)
 
-        # Call Bedrock API
-        response = client.messages.create(
-            model=os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514"),
-            max_tokens=2048,
-            system=ORCHESTRATOR_SYSTEM_PROMPT,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-
-        return response.content[0].text
+        return {
+            "alert": alert_str,
+            "pred": prediction_summary,
+            "ets": ets_snippet or 'none',
+            "lp": learned['successful_patterns'],
+        }
 
-    def _log_decision(self, incident_id, synthesis):
+    def _log_decision(self, incident_id, synthesis_text):
         self.audit_log.append({
             "incident_id": incident_id,
-            "decision": str(synthesis)[:150]
+            "decision": synthesis_text[:150]
         })
 
 # Global instance
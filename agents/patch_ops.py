@@ -1,17 +1,20 @@
-from config.bedrock_client import BedrockClient
+from config.bedrock_batcher import batcher
 from agents.strands_tools import (
     run_preflight_checks,
     deploy_canary,
+    deploy_canary_async,
     verify_health,
     rollback_patch,
-    deploy_full_patch
+    rollback_patch_async,
+    deploy_full_patch,
+    deploy_full_patch_async
 )
 from config.knowledge_base import kb
+from config import kb_cache
 from config.terminal_logger import terminal_logger
-import os
+import asyncio
 import json
-
-client = BedrockClient(region_name=os.getenv("AWS_REGION", "us-east-1"))
+import os
 
 PATCH_OPS_SYSTEM_PROMPT = """You are PatchOps, the safe patching specialist with autonomous deployment capabilities.
 
@@ -38,9 +41,102 @@ Learn from past patch outcomes. Check knowledge base for:
 Provide detailed execution plans with timelines."""
 
 
+# Hosts patched concurrently by safe_patch_deployment_fleet
+PATCH_FLEET_MAX_PARALLEL = int(os.getenv("PATCH_FLEET_MAX_PARALLEL", "8"))
+
+
 def safe_patch_deployment(host: str, patch_id: str):
     """Execute safe patch deployment with canary using Anthropic SDK"""
+    # Narrative lines are published in two groups: before the Bedrock wait and when the block exits
+    with terminal_logger.batch():
+        context = _begin_patch(host, patch_id)
+
+        # Execute patch deployment workflow
+        preflight = run_preflight_checks(host, patch_id)
+        canary_result = None
+        health_result = None
+        final_deployment = None
+
+        if preflight['overall_status'] == 'passed':
+            canary_result = deploy_canary(host, patch_id, canary_percentage=25)
+            if canary_result['status'] == 'success':
+                health_result = verify_health(host, checks=["cpu", "memory", "services", "connectivity"])
+                if health_result['overall_health'] == 'healthy':
+                    final_deployment = deploy_full_patch(host, patch_id)
+                else:
+                    rollback_result = rollback_patch(host, patch_id, "Health check failed after canary")
+                    final_deployment = rollback_result
+
+        prompt = _build_patch_prompt(host, patch_id, context, preflight, canary_result, health_result, final_deployment)
+
+        # Publish the narrative so far: the streaming progress lines come from the
+        # batcher thread and must follow it, not overtake it
+        terminal_logger.flush_batch()
+
+        # Call Bedrock API (coalesced with concurrent PatchOps requests)
+        response_text = batcher.submit(
+            PATCH_OPS_SYSTEM_PROMPT, prompt, max_tokens=1024,
+            on_text=terminal_logger.stream_progress("PatchOps streaming deployment summary", "PATCHOPS")
+        ).result()
+
+        return _finish_patch(host, patch_id, response_text)
+
+
+async def safe_patch_deployment_async(host: str, patch_id: str):
+    """safe_patch_deployment with non-blocking deployment stages and Bedrock wait"""
+    context = _begin_patch(host, patch_id)
+
+    preflight = run_preflight_checks(host, patch_id)
+    canary_result = None
+    health_result = None
+    final_deployment = None
+
+    if preflight['overall_status'] == 'passed':
+        canary_result = await deploy_canary_async(host, patch_id, canary_percentage=25)
+        if canary_result['status'] == 'success':
+            health_result = verify_health(host, checks=["cpu", "memory", "services", "connectivity"])
+            if health_result['overall_health'] == 'healthy':
+                final_deployment = await deploy_full_patch_async(host, patch_id)
+            else:
+                final_deployment = await rollback_patch_async(host, patch_id, "Health check failed after canary")
+
+    prompt = _build_patch_prompt(host, patch_id, context, preflight, canary_result, health_result, final_deployment)
 
+    # Concurrent hosts land in the same batcher window and share a Bedrock call
+    response_text = await asyncio.wrap_future(batcher.submit(
+        PATCH_OPS_SYSTEM_PROMPT, prompt, max_tokens=1024,
+        on_text=terminal_logger.stream_progress(f"PatchOps streaming deployment summary for {host}", "PATCHOPS")
+    ))
+
+    return _finish_patch(host, patch_id, response_text)
+
+
+async def safe_patch_deployment_fleet(hosts, patch_id: str, max_parallel: int = None):
+    """Patch several hosts with overlapping canary workflows
+
+    Args:
+        hosts: Hosts to patch
+        patch_id: Patch identifier
+        max_parallel: Maximum hosts in flight at once (defaults to PATCH_FLEET_MAX_PARALLEL)
+
+    Returns:
+        List of per-host deployment summaries in input order
+    """
+    semaphore = asyncio.Semaphore(max_parallel or PATCH_FLEET_MAX_PARALLEL)
+
+    async def patch_one(host):
+        async with semaphore:
+            return await safe_patch_deployment_async(host, patch_id)
+
+    terminal_logger.add_log(
+        f"PatchOps rolling out patch {patch_id} across {len(hosts)} hosts",
+        "PATCHOPS"
+    )
+    return await asyncio.gather(*[patch_one(h) for h in hosts])
+
+
+def _begin_patch(host: str, patch_id: str) -> str:
+    """Log the evaluation narrative and return the historical-data prompt context"""
     # NARRATIVE: Starting patch evaluation
     terminal_logger.add_log(
         f"PatchOps evaluating patch {patch_id} for deployment to {host}",
@@ -48,7 +144,7 @@ def safe_patch_deployment(host: str, patch_id: str):
     )
 
     # Check past patterns
-    patterns = kb.get_patterns_by_type('patch_deployment')
+    patterns = kb_cache.get_patterns_by_type('patch_deployment')
     context = ""
     if patterns:
         context = f"\n\nHistorical data: {len(patterns)} past deployments found."
@@ -69,25 +165,12 @@ def safe_patch_deployment(host: str, patch_id: str):
         "PatchOps initiating canary deployment workflow (preflight -> canary -> verify -> full)",
         "PATCHOPS"
     )
+    return context
 
-    # Execute patch deployment workflow
-    preflight = run_preflight_checks(host, patch_id)
-    canary_result = None
-    health_result = None
-    final_deployment = None
-
-    if preflight['overall_status'] == 'passed':
-        canary_result = deploy_canary(host, patch_id, canary_percentage=25)
-        if canary_result['status'] == 'success':
-            health_result = verify_health(host, checks=["cpu", "memory", "services", "connectivity"])
-            if health_result['overall_health'] == 'healthy':
-                final_deployment = deploy_full_patch(host, patch_id)
-            else:
-                rollback_result = rollback_patch(host, patch_id, "Health check failed after canary")
-                final_deployment = rollback_result
 
-    # Build comprehensive prompt with all execution results
-    prompt = f"""Execute safe patch deployment for {patch_id} on {host}.{context}
+def _build_patch_prompt(host, patch_id, context, preflight, canary_result, health_result, final_deployment) -> str:
+    """Build comprehensive prompt with all execution results"""
+    return f"""Execute safe patch deployment for {patch_id} on {host}.{context}
 
 Canary deployment workflow execution results:
 
@@ -109,18 +192,9 @@ Based on this execution, provide:
 2. Risk assessment
 3. Lessons learned for future deployments"""
 
-    # Call Bedrock API
-    response = client.messages.create(
-        model=os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514"),
-        max_tokens=1024,
-        system=PATCH_OPS_SYSTEM_PROMPT,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
-    )
-
-    response_text = response.content[0].text
 
+def _finish_patch(host: str, patch_id: str, response_text: str) -> str:
+    """Record the deployment outcome in the KB and return the summary"""
     # NARRATIVE: Deployment decision
     terminal_logger.add_log(
         f"PatchOps patch deployment workflow completed for {patch_id}",
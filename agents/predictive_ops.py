@@ -1,11 +1,11 @@
-from config.bedrock_client import BedrockClient
+from config.bedrock_batcher import batcher
 from agents.strands_tools import predict_failure
 from config.terminal_logger import terminal_logger
 from agents.ets_forecaster import generate_ets_summary
-import os
+from data.models import MetricBatch
 import json
 
-client = BedrockClient(region_name=os.getenv("AWS_REGION", "us-east-1"))
+import numpy as np
 
 PREDICTIVE_OPS_SYSTEM_PROMPT = """You are PredictiveOps, an expert at predicting system failures before they occur.
 
@@ -27,70 +27,101 @@ Output format:
 - Recommended preventive actions"""
 
 
-def analyze_metrics(metrics, forecast_hours=2):
-    """Analyze metrics through PredictiveOps using Anthropic SDK with ETS assist"""
-    metric_dicts = [
-        {
-            "host": m.host,
-            "metric_name": m.metric_name,
-            "value": m.value,
-            "timestamp": m.timestamp.isoformat() if hasattr(m.timestamp, 'isoformat') else str(m.timestamp)
-        }
-        for m in metrics
-    ]
-
-    # NARRATIVE: Identify metric types being analyzed
-    metric_types = list(set([m.metric_name for m in metrics]))
-    hosts = list(set([m.host for m in metrics]))
-    terminal_logger.add_log(
-        f"PredictiveOps analyzing {len(metrics)} data points across {len(metric_types)} metric types from {len(hosts)} host(s)",
-        "PREDICTIVEOPS"
-    )
-
-    # NARRATIVE: Forecast window
-    terminal_logger.add_log(
-        f"PredictiveOps forecasting {forecast_hours} hours ahead using time-series analysis",
-        "PREDICTIVEOPS"
+def _metric_digest(batch: MetricBatch) -> str:
+    """One compact line per (host, metric): last, mean and least-squares slope per sample
+
+    Replaces dumping raw metric dicts into the prompt; the model only needs the shape
+    of each series, and this costs a fraction of the tokens.
+    """
+    if not len(batch):
+        return "(no metrics)"
+
+    keys, codes = batch.series()
+    order = np.lexsort((batch.timestamp, codes))
+    codes = codes[order]
+    v = batch.value[order]
+
+    # Position of each point within its series, then slope = cov(x, v) / var(x) per series
+    n = np.bincount(codes, minlength=len(keys))
+    starts = np.cumsum(n) - n
+    x = np.arange(len(v)) - starts[codes]
+    x_mean = np.bincount(codes, x) / n
+    v_mean = np.bincount(codes, v) / n
+    cov = np.bincount(codes, (x - x_mean[codes]) * (v - v_mean[codes]))
+    var = np.bincount(codes, (x - x_mean[codes]) ** 2)
+    slopes = np.divide(cov, var, out=np.zeros_like(cov), where=var > 0)
+    last = v[starts + n - 1]
+
+    hosts = batch.host[order][starts].tolist()
+    names = batch.metric_name[order][starts].tolist()
+    return "\n".join(
+        f"{host}|{metric}: n={count} last={last_v:.1f} mean={mean_v:.1f} slope={slope:+.2f}"
+        for host, metric, count, last_v, mean_v, slope in zip(
+            hosts, names, n.tolist(), last.tolist(), v_mean.tolist(), slopes.tolist()
+        )
     )
 
-    # ETS: deterministic lightweight forecast to augment LLM output
-    ets_points = max(4, int(forecast_hours * 12))  # approx 5m buckets for given horizon
-    ets_summary = generate_ets_summary(metric_dicts, horizon=ets_points)
 
-    if ets_summary.get("series"):
+def analyze_metrics(metrics, forecast_hours=2):
+    """Analyze metrics through PredictiveOps using Anthropic SDK with ETS assist"""
+    # Narrative lines are published in two groups: before the Bedrock wait and when the block exits
+    with terminal_logger.batch():
+        # One pass converts the Metric objects to columns; the narrative counts, the
+        # prompt digest and the tool payload are all derived from those arrays
+        batch = MetricBatch.from_metrics(metrics)
+        metric_dicts = batch.to_dicts()
+        metric_types = np.unique(batch.metric_name.astype(str))
+        hosts = np.unique(batch.host.astype(str))
+
+        # NARRATIVE: Identify metric types being analyzed
         terminal_logger.add_log(
-            f"PredictiveOps ETS forecasting covered {len(ets_summary['series'])} series; top anomaly z-score "
-            f"{ets_summary['top_anomalies'][0]['z_score'] if ets_summary.get('top_anomalies') else 0}",
+            f"PredictiveOps analyzing {len(metrics)} data points across {len(metric_types)} metric types from {len(hosts)} host(s)",
             "PREDICTIVEOPS"
         )
-    else:
+
+        # NARRATIVE: Forecast window
         terminal_logger.add_log(
-            "PredictiveOps ETS forecasting skipped (insufficient data)",
+            f"PredictiveOps forecasting {forecast_hours} hours ahead using time-series analysis",
             "PREDICTIVEOPS"
         )
 
-    # Call predict_failure tool directly
-    prediction_result = predict_failure(metric_dicts, forecast_hours=forecast_hours)
+        # ETS: deterministic lightweight forecast to augment LLM output
+        ets_points = max(4, int(forecast_hours * 12))  # approx 5m buckets for given horizon
+        ets_summary = generate_ets_summary(metric_dicts, horizon=ets_points)
 
-    # Include metrics and prediction in prompt
-    prompt = f"""Analyze these {len(metrics)} metric data points for potential failures.
+        if ets_summary.get("series"):
+            terminal_logger.add_log(
+                f"PredictiveOps ETS forecasting covered {len(ets_summary['series'])} series; top anomaly z-score "
+                f"{ets_summary['top_anomalies'][0]['z_score'] if ets_summary.get('top_anomalies') else 0}",
+                "PREDICTIVEOPS"
+            )
+        else:
+            terminal_logger.add_log(
+                "PredictiveOps ETS forecasting skipped (insufficient data)",
+                "PREDICTIVEOPS"
+            )
 
-Metrics data:
-{json.dumps(metric_dicts[:10], indent=2)}
-... and {len(metrics)-10} more data points
+        # Call predict_failure tool directly
+        prediction_result = predict_failure(metric_dicts, forecast_hours=forecast_hours)
+
+        # Include metrics and prediction in prompt
+        prompt = f"""Analyze these {len(metrics)} metric data points for potential failures.
+
+Metrics data (per host|metric over the window):
+{_metric_digest(batch)}
 
 Forecast window: {forecast_hours} hours ahead
 
 Prediction analysis results:
 - Risk Level: {prediction_result['risk_level']}
 - Confidence: {prediction_result['confidence']}
-- Forecast Details: {json.dumps(prediction_result['forecast'], indent=2) if prediction_result['forecast'] else 'No concerning trends'}
+- Forecast Details: {json.dumps(prediction_result['forecast'], separators=(',', ':')) if prediction_result['forecast'] else 'No concerning trends'}
 - Reasoning: {', '.join(prediction_result['reasoning'])}
 
 ETS (Holt linear) forecast summary:
 - Series analyzed: {len(ets_summary.get('series', []))}
-- Top anomalies (z-score): {json.dumps(ets_summary.get('top_anomalies', [])[:2], indent=2)}
-- Sample forecast: {json.dumps(ets_summary.get('series', [])[:1], indent=2)}
+- Top anomalies (z-score): {json.dumps(ets_summary.get('top_anomalies', [])[:2], separators=(',', ':'))}
+- Sample forecast: {json.dumps(ets_summary.get('series', [])[:1], separators=(',', ':'))}
 
 Based on this prediction analysis, provide:
 1. Risk assessment summary
@@ -98,28 +129,26 @@ Based on this prediction analysis, provide:
 3. Recommended preventive actions
 4. Time window for intervention"""
 
-    # Call Bedrock API
-    response = client.messages.create(
-        model=os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514"),
-        max_tokens=1024,
-        system=PREDICTIVE_OPS_SYSTEM_PROMPT,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
-    )
+        # Publish the narrative so far: the streaming progress lines come from the
+        # batcher thread and must follow it, not overtake it
+        terminal_logger.flush_batch()
 
-    response_text = response.content[0].text
+        # Call Bedrock API (coalesced with concurrent PredictiveOps requests)
+        response_text = batcher.submit(
+            PREDICTIVE_OPS_SYSTEM_PROMPT, prompt, max_tokens=1024,
+            on_text=terminal_logger.stream_progress("PredictiveOps streaming risk assessment", "PREDICTIVEOPS")
+        ).result()
 
-    # NARRATIVE: Analysis results
-    terminal_logger.add_log(
-        f"PredictiveOps trend analysis complete - Risk assessment generated for {len(hosts)} host(s)",
-        "PREDICTIVEOPS"
-    )
+        # NARRATIVE: Analysis results
+        terminal_logger.add_log(
+            f"PredictiveOps trend analysis complete - Risk assessment generated for {len(hosts)} host(s)",
+            "PREDICTIVEOPS"
+        )
 
-    # Return structured result with backward-compatible summary
-    return {
-        "text": response_text,
-        "ets": ets_summary,
-        "risk_level": prediction_result.get("risk_level"),
-        "confidence": prediction_result.get("confidence")
-    }
+        # Return structured result with backward-compatible summary
+        return {
+            "text": response_text,
+            "ets": ets_summary,
+            "risk_level": prediction_result.get("risk_level"),
+            "confidence": prediction_result.get("confidence")
+        }
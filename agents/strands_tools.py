@@ -1,9 +1,14 @@
 """Clean tool functions for OpsForge AI agents (ready for Anthropic integration)"""
 
+from collections import defaultdict
 from typing import List, Dict
 from datetime import datetime, timedelta
-import statistics
-import networkx as nx
+import numpy as np
+import pandas as pd
+from config.jit import njit, NUMBA_AVAILABLE
+from config.isotime import parse_iso
+import asyncio
+import sys
 import time
 import random
 
@@ -11,6 +16,149 @@ import random
 # ALERT CORRELATION TOOLS
 # ============================================================================
 
+def _parse_epoch(ts) -> float:
+    """Epoch seconds for a datetime or ISO-8601 string (trailing 'Z' accepted)"""
+    if isinstance(ts, str):
+        ts = parse_iso(ts)
+    return ts.timestamp()
+
+
+class _UnionFind:
+    """Array-based disjoint sets over 0..n-1; the root of each set is its smallest index"""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            if ri < rj:
+                self.parent[rj] = ri
+            else:
+                self.parent[ri] = rj
+
+
+def _correlation_candidates(ts_arr, keywords, host_ids) -> List[tuple]:
+    """Index pairs (i < j) that can reach the 0.5 edge threshold in correlate_alerts
+
+    An edge needs either time proximity (< 60s) or a same-host keyword match, so
+    candidates are the pairs inside a sliding 60s window over the sorted
+    timestamps plus same-host pairs sharing a title keyword. Everything else
+    scores at most 0.4 and is never compared.
+    """
+    candidates = set()
+
+    # Time-window pairs: sweep alerts in timestamp order
+    order = np.argsort(ts_arr, kind="stable")
+    sorted_ts = ts_arr[order]
+    window_end = np.searchsorted(sorted_ts, sorted_ts + 60, side="left")
+    for pos in range(len(order)):
+        i = int(order[pos])
+        for j in order[pos + 1:window_end[pos]].tolist():
+            candidates.add((i, j) if i < j else (j, i))
+
+    # Same-host pairs sharing a keyword: inverted index per host
+    postings = {}
+    for idx, (host_id, words) in enumerate(zip(host_ids, keywords)):
+        for word in words:
+            postings.setdefault((host_id, word), []).append(idx)
+    for indices in postings.values():
+        for a in range(len(indices)):
+            for b in range(a + 1, len(indices)):
+                candidates.add((indices[a], indices[b]))
+
+    return sorted(candidates)
+
+
+def _pair_score(same_host: bool, time_diff: float, overlap: int) -> float:
+    """Correlation score for one alert pair; an edge needs more than 0.5"""
+    score = 0.0
+
+    # Same host correlation
+    if same_host:
+        score += 0.4
+
+    # Time proximity (within 60 seconds)
+    if abs(time_diff) < 60:
+        score += 0.3
+
+    # Keyword matching
+    if overlap > 0:
+        score += min(0.3, overlap * 0.1)
+
+    return score
+
+
+@njit(cache=True, nogil=True)
+def _score_pairs(cand_i, cand_j, host_ids, ts, word_ids, word_off):
+    """Edge mask for candidate pairs, mirroring _pair_score on interned arrays
+
+    Each alert's title words are a sorted run word_ids[word_off[k]:word_off[k + 1]],
+    so keyword overlap is a merge count. Runs serially: parallel numba kernels
+    hang interpreter shutdown when launched from the orchestrator's worker threads.
+    """
+    n = cand_i.shape[0]
+    is_edge = np.zeros(n, dtype=np.bool_)
+    for k in range(n):
+        i = cand_i[k]
+        j = cand_j[k]
+        score = 0.0
+        if host_ids[i] == host_ids[j]:
+            score += 0.4
+        if abs(ts[i] - ts[j]) < 60:
+            score += 0.3
+
+        overlap = 0
+        a = word_off[i]
+        a_end = word_off[i + 1]
+        b = word_off[j]
+        b_end = word_off[j + 1]
+        while a < a_end and b < b_end:
+            if word_ids[a] == word_ids[b]:
+                overlap += 1
+                a += 1
+                b += 1
+            elif word_ids[a] < word_ids[b]:
+                a += 1
+            else:
+                b += 1
+        if overlap > 0:
+            score += min(0.3, overlap * 0.1)
+
+        is_edge[k] = score > 0.5
+    return is_edge
+
+
+def _encode_keywords(keywords: List[frozenset]) -> tuple:
+    """Intern title words to ints; returns (sorted word ids per alert, CSR offsets)"""
+    vocab = {}
+    word_off = np.zeros(len(keywords) + 1, dtype=np.int64)
+    flat = []
+    for k, words in enumerate(keywords):
+        flat.extend(sorted(vocab.setdefault(w, len(vocab)) for w in words))
+        word_off[k + 1] = len(flat)
+    return np.array(flat, dtype=np.int64), word_off
+
+
+def _keyword_bitsets(keywords: List[frozenset]) -> List[int]:
+    """One bit per distinct title word across the batch, OR-ed per alert"""
+    vocab = {}
+    bitsets = []
+    for words in keywords:
+        bits = 0
+        for w in words:
+            bits |= 1 << vocab.setdefault(w, len(vocab))
+        bitsets.append(bits)
+    return bitsets
+
+
 def correlate_alerts(alerts: List[Dict]) -> Dict:
     """
     Correlate related alerts using graph analysis.
@@ -31,74 +179,67 @@ def correlate_alerts(alerts: List[Dict]) -> Dict:
             "suppressed_count": 0
         }
 
-    # Build correlation graph
-    G = nx.Graph()
-
+    # Correlation graph as union-find over alert indices; alerts sharing an
+    # alert_id are the same node
+    uf = _UnionFind(len(alerts))
+    first_by_id = {}
+    for idx, alert in enumerate(alerts):
+        uf.union(first_by_id.setdefault(alert["alert_id"], idx), idx)
+
+    # Parse timestamps once, and intern hosts to small ints and titles to shared
+    # keyword sets so pair checks compare ints instead of hashing strings
+    ts_arr = np.array([_parse_epoch(a["timestamp"]) for a in alerts], dtype=np.float64)
+    host_index = {}
+    host_ids = [host_index.setdefault(a["host"], len(host_index)) for a in alerts]
+    title_keywords = {}
+    keywords = []
     for alert in alerts:
-        G.add_node(alert["alert_id"], **alert)
-
-    # Add edges based on correlation factors
-    for i, alert1 in enumerate(alerts):
-        for alert2 in alerts[i+1:]:
-            score = 0.0
-            reasons = []
-
-            # Same host correlation
-            if alert1["host"] == alert2["host"]:
-                score += 0.4
-                reasons.append("same_host")
-
-            # Time proximity (within 60 seconds)
-            # Handle both datetime objects and ISO strings
-            ts1 = alert1["timestamp"]
-            ts2 = alert2["timestamp"]
-            if isinstance(ts1, str):
-                ts1 = datetime.fromisoformat(ts1.replace('Z', '+00:00'))
-            if isinstance(ts2, str):
-                ts2 = datetime.fromisoformat(ts2.replace('Z', '+00:00'))
-
-            time_diff = abs((ts1 - ts2).total_seconds())
-            if time_diff < 60:
-                score += 0.3
-                reasons.append("time_proximity")
-
-            # Keyword matching
-            keywords1 = set(alert1["title"].lower().split())
-            keywords2 = set(alert2["title"].lower().split())
-            overlap = len(keywords1 & keywords2)
-            if overlap > 0:
-                score += min(0.3, overlap * 0.1)
-                reasons.append("keyword_match")
-
-            if score > 0.5:
-                G.add_edge(alert1["alert_id"], alert2["alert_id"],
-                          weight=score, reasons=reasons)
+        title = alert["title"]
+        words = title_keywords.get(title)
+        if words is None:
+            words = title_keywords[title] = frozenset(map(sys.intern, title.lower().split()))
+        keywords.append(words)
+
+    # Add edges based on correlation factors, scoring only candidate pairs
+    candidates = _correlation_candidates(ts_arr, keywords, host_ids)
+    if NUMBA_AVAILABLE and candidates:
+        # JIT path: title words encoded as ints too, all pairs scored in one call
+        word_ids, word_off = _encode_keywords(keywords)
+        pairs = np.array(candidates, dtype=np.int64)
+        is_edge = _score_pairs(pairs[:, 0], pairs[:, 1], np.array(host_ids, dtype=np.int32),
+                               ts_arr, word_ids, word_off)
+        edges = pairs[is_edge].tolist()
+    else:
+        # Title words as int bitsets: overlap is a popcount instead of a set intersection
+        word_bits = _keyword_bitsets(keywords)
+        edges = [
+            (i, j) for i, j in candidates
+            if _pair_score(host_ids[i] == host_ids[j], ts_arr[i] - ts_arr[j], (word_bits[i] & word_bits[j]).bit_count()) > 0.5
+        ]
+
+    for i, j in edges:
+        uf.union(i, j)
+    has_edges = bool(edges)
 
     # Find largest connected component (main incident cluster)
-    if G.number_of_edges() > 0:
-        components = list(nx.connected_components(G))
-        largest = max(components, key=len)
+    if has_edges:
+        components = defaultdict(list)
+        for i in range(len(alerts)):
+            components[uf.find(i)].append(i)
+        # Size counts distinct alert IDs; ties go to the component seen first
+        largest_idx = max(components.values(), key=lambda c: len({alerts[i]["alert_id"] for i in c}))
+        largest = {alerts[i]["alert_id"] for i in largest_idx}
 
         # Identify root cause (earliest alert in cluster)
-        cluster_alerts = [alerts[i] for i, a in enumerate(alerts)
-                         if a["alert_id"] in largest]
-
-        # Sort by timestamp (handle both datetime and string)
-        def get_timestamp(alert):
-            ts = alert["timestamp"]
-            if isinstance(ts, str):
-                return datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            return ts
-
-        cluster_alerts.sort(key=get_timestamp)
+        cluster_idx = list(largest_idx)
+        cluster_idx.sort(key=lambda i: ts_arr[i])
+        cluster_alerts = [alerts[i] for i in cluster_idx]
         primary = cluster_alerts[0]
 
         related_ids = [a["alert_id"] for a in cluster_alerts[1:]]
 
         # Calculate time span
-        first_ts = get_timestamp(cluster_alerts[0])
-        last_ts = get_timestamp(cluster_alerts[-1])
-        time_span = int((last_ts - first_ts).total_seconds())
+        time_span = int(ts_arr[cluster_idx[-1]] - ts_arr[cluster_idx[0]])
 
         return {
             "primary_alert_id": primary["alert_id"],
@@ -128,6 +269,13 @@ def correlate_alerts(alerts: List[Dict]) -> Dict:
 # PREDICTIVE ANALYSIS TOOLS
 # ============================================================================
 
+# (metric family, mean above which a series is at risk, current value above which
+# the risk is high), checked in order
+FAILURE_THRESHOLDS = (
+    ("cpu", 80, 90),
+    ("memory", 85, 92),
+)
+
 
 def predict_failure(metrics: List[Dict], forecast_hours: int = 2) -> Dict:
     """
@@ -148,41 +296,41 @@ def predict_failure(metrics: List[Dict], forecast_hours: int = 2) -> Dict:
             "reasoning": ["Insufficient data for prediction"]
         }
 
-    # Group by metric type
-    by_metric = {}
-    for m in metrics:
-        key = f"{m['host']}_{m['metric_name']}"
-        if key not in by_metric:
-            by_metric[key] = []
-        by_metric[key].append(m)
-
-    predictions = []
-
-    for key, data in by_metric.items():
-        data.sort(key=lambda x: x["timestamp"])
-        values = [d["value"] for d in data]
-
-        # Simple trend analysis
-        if len(values) >= 3:
-            recent_trend = values[-1] - values[-3]
-            avg_value = statistics.mean(values)
-
-            # Predict failure conditions
-            if "cpu" in key and avg_value > 80:
-                predictions.append({
-                    "metric": key,
-                    "current": values[-1],
-                    "trend": "increasing" if recent_trend > 0 else "stable",
-                    "risk": "high" if values[-1] > 90 else "medium"
-                })
-
-            elif "memory" in key and avg_value > 85:
-                predictions.append({
-                    "metric": key,
-                    "current": values[-1],
-                    "trend": "increasing" if recent_trend > 0 else "stable",
-                    "risk": "high" if values[-1] > 92 else "medium"
-                })
+    # Group by metric type: one stable sort by (series, timestamp), then per-series
+    # stats are read off group boundaries instead of looping in Python
+    df = pd.DataFrame(metrics, columns=["host", "metric_name", "value", "timestamp"])
+    keys = df["host"].astype(str) + "_" + df["metric_name"].astype(str)
+    codes, uniques = pd.factorize(keys)  # series numbered in first-appearance order
+    df["_series"] = codes
+    df = df.sort_values(["_series", "timestamp"], kind="stable")
+
+    values = df["value"].to_numpy()
+    counts = np.bincount(codes, minlength=len(uniques))
+    ends = np.cumsum(counts)
+    has_trend = counts >= 3
+    means = np.add.reduceat(values.astype(float), ends - counts) / counts
+    last = values[ends - 1]
+    recent_trend = np.where(has_trend, last - values[np.maximum(ends - 3, 0)], 0)
+
+    # Predict failure conditions from the threshold table; a series is flagged by
+    # the first family whose rule fires
+    names = pd.Series(uniques)
+    flagged = np.zeros(len(uniques), dtype=bool)
+    high_limit = np.zeros(len(uniques))
+    for family, mean_limit, current_limit in FAILURE_THRESHOLDS:
+        fires = has_trend & ~flagged & names.str.contains(family, regex=False).to_numpy() & (means > mean_limit)
+        high_limit[fires] = current_limit
+        flagged |= fires
+
+    predictions = [
+        {
+            "metric": uniques[i],
+            "current": last[i].item() if hasattr(last[i], "item") else last[i],
+            "trend": "increasing" if recent_trend[i] > 0 else "stable",
+            "risk": "high" if last[i] > high_limit[i] else "medium"
+        }
+        for i in np.flatnonzero(flagged)
+    ]
 
     if predictions:
         high_risk = any(p["risk"] == "high" for p in predictions)
@@ -209,6 +357,15 @@ def predict_failure(metrics: List[Dict], forecast_hours: int = 2) -> Dict:
 # PATCH MANAGEMENT TOOLS
 # ============================================================================
 
+# Simulated stage durations; the *_async variants await instead of blocking so
+# PatchOps can overlap stages across a fleet
+CANARY_DEPLOY_SECONDS = 0.5
+ROLLBACK_SECONDS = 0.3
+FULL_DEPLOY_SECONDS = 1.0
+
+# Shared generator for simulated health readings
+_rng = np.random.default_rng()
+
 
 def run_preflight_checks(host: str, patch_id: str) -> Dict:
     """
@@ -253,8 +410,17 @@ def deploy_canary(host: str, patch_id: str, canary_percentage: int = 25) -> Dict
     Returns:
         Canary deployment status
     """
-    time.sleep(0.5)
+    time.sleep(CANARY_DEPLOY_SECONDS)
+    return _canary_result(host, patch_id, canary_percentage)
+
+
+async def deploy_canary_async(host: str, patch_id: str, canary_percentage: int = 25) -> Dict:
+    """Non-blocking deploy_canary for fleet rollouts"""
+    await asyncio.sleep(CANARY_DEPLOY_SECONDS)
+    return _canary_result(host, patch_id, canary_percentage)
 
+
+def _canary_result(host: str, patch_id: str, canary_percentage: int) -> Dict:
     success = random.random() > 0.2
 
     return {
@@ -279,28 +445,49 @@ def verify_health(host: str, checks: List[str] = None) -> Dict:
     Returns:
         Health check results
     """
+    return verify_health_batch([host], checks)[0]
+
+
+def verify_health_batch(hosts: List[str], checks: List[str] = None) -> List[Dict]:
+    """
+    Verify health for a fleet of hosts with one vectorized draw per check
+
+    Args:
+        hosts: Hosts to check
+        checks: List of checks to run (cpu, memory, services, connectivity)
+
+    Returns:
+        Health check results per host, in input order
+    """
     if not checks:
         checks = ["cpu", "memory", "services", "connectivity"]
 
-    results = {}
+    n = len(hosts)
+    # Each check draws its column for the whole fleet at once
+    columns = {}
     for check in checks:
         if check == "cpu":
-            results[check] = {"status": "healthy", "value": random.randint(20, 45)}
+            columns[check] = [{"status": "healthy", "value": v} for v in _rng.integers(20, 46, size=n).tolist()]
         elif check == "memory":
-            results[check] = {"status": "healthy", "value": random.randint(40, 65)}
+            columns[check] = [{"status": "healthy", "value": v} for v in _rng.integers(40, 66, size=n).tolist()]
         elif check == "services":
-            results[check] = {"status": random.choice(["healthy", "healthy", "degraded"])}
+            degraded = (_rng.random(n) < 1 / 3).tolist()
+            columns[check] = [{"status": "degraded" if d else "healthy"} for d in degraded]
         elif check == "connectivity":
-            results[check] = {"status": "healthy", "latency_ms": random.randint(5, 20)}
-
-    all_healthy = all(r["status"] == "healthy" for r in results.values())
+            columns[check] = [{"status": "healthy", "latency_ms": v} for v in _rng.integers(5, 21, size=n).tolist()]
 
-    return {
-        "host": host,
-        "overall_health": "healthy" if all_healthy else "degraded",
-        "checks": results,
-        "timestamp": time.time()
-    }
+    now = time.time()
+    results = []
+    for row, host in enumerate(hosts):
+        host_checks = {check: column[row] for check, column in columns.items()}
+        all_healthy = all(r["status"] == "healthy" for r in host_checks.values())
+        results.append({
+            "host": host,
+            "overall_health": "healthy" if all_healthy else "degraded",
+            "checks": host_checks,
+            "timestamp": now
+        })
+    return results
 
 
 
@@ -316,8 +503,17 @@ def rollback_patch(host: str, patch_id: str, reason: str) -> Dict:
     Returns:
         Rollback status
     """
-    time.sleep(0.3)
+    time.sleep(ROLLBACK_SECONDS)
+    return _rollback_result(host, patch_id, reason)
+
+
+async def rollback_patch_async(host: str, patch_id: str, reason: str) -> Dict:
+    """Non-blocking rollback_patch for fleet rollouts"""
+    await asyncio.sleep(ROLLBACK_SECONDS)
+    return _rollback_result(host, patch_id, reason)
+
 
+def _rollback_result(host: str, patch_id: str, reason: str) -> Dict:
     return {
         "host": host,
         "patch_id": patch_id,
@@ -340,8 +536,17 @@ def deploy_full_patch(host: str, patch_id: str) -> Dict:
     Returns:
         Full deployment status
     """
-    time.sleep(1)
+    time.sleep(FULL_DEPLOY_SECONDS)
+    return _full_patch_result(host, patch_id)
+
+
+async def deploy_full_patch_async(host: str, patch_id: str) -> Dict:
+    """Non-blocking deploy_full_patch for fleet rollouts"""
+    await asyncio.sleep(FULL_DEPLOY_SECONDS)
+    return _full_patch_result(host, patch_id)
+
 
+def _full_patch_result(host: str, patch_id: str) -> Dict:
     phases = [
         {"phase": 1, "hosts": 25, "status": "completed"},
         {"phase": 2, "hosts": 50, "status": "completed"},
@@ -1,4 +1,4 @@
-from config.bedrock_client import BedrockClient
+from config.bedrock_batcher import batcher
 from agents.strands_tools import (
     execute_vpn_reset,
     verify_backup,
@@ -8,10 +8,10 @@ from agents.strands_tools import (
 )
 from config.knowledge_base import kb
 from config.terminal_logger import terminal_logger
+import orjson
 import os
-import json
 
-client = BedrockClient(region_name=os.getenv("AWS_REGION", "us-east-1"))
+MODEL_ID = os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514")
 
 TASK_OPS_SYSTEM_PROMPT = """You are TaskOps, automating routine IT tasks.
 
@@ -35,10 +35,51 @@ SAFETY:
 
 Save ~8 hours/engineer/week by automating routine work."""
 
+# Static part of every task prompt; sent after the system prompt so both form
+# one stable prefix that can be cached, ahead of the per-task details
+TASK_OPS_INSTRUCTIONS = """Based on the execution results in the request, provide:
+1. Task completion status
+2. Any issues encountered
+3. Recommendations for optimization"""
+
+# Models that accept cache_control on content blocks; others get a plain string
+PROMPT_CACHE_MODELS = ("claude-sonnet-4", "claude-opus-4", "claude-3-7-sonnet", "claude-3-5-")
+PROMPT_CACHING = MODEL_ID.rsplit("anthropic.", 1)[-1].startswith(PROMPT_CACHE_MODELS)
+
+if PROMPT_CACHING:
+    TASK_OPS_SYSTEM = [
+        {"type": "text", "text": TASK_OPS_SYSTEM_PROMPT},
+        {"type": "text", "text": TASK_OPS_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}},
+    ]
+else:
+    TASK_OPS_SYSTEM = f"{TASK_OPS_SYSTEM_PROMPT}\n\n{TASK_OPS_INSTRUCTIONS}"
+
+# Prompt JSON is compact; TASK_OPS_PRETTY_PROMPTS=1 indents it for debugging
+_DUMP_OPTION = orjson.OPT_INDENT_2 if os.getenv("TASK_OPS_PRETTY_PROMPTS", "0") == "1" else 0
+
+
+# Task type -> tool call taking the request params
+TASK_TOOLS = {
+    'vpn_reset': lambda p: execute_vpn_reset(p.get('user', 'unknown'), p.get('vpn_server', 'vpn-01')),
+    'verify_backup': lambda p: verify_backup(p.get('host', 'unknown'), p.get('backup_type', 'full')),
+    'audit_licenses': lambda p: audit_licenses(p.get('service', 'unknown')),
+    'clear_disk_space': lambda p: clear_disk_space(p.get('host', 'unknown'), p.get('target_gb', 10)),
+    'restart_service': lambda p: restart_service(p.get('host', 'unknown'), p.get('service_name', 'unknown'), verify_startup=True),
+}
+
 
 def automate_task(task_type: str, params: dict):
     """Execute automated task using Anthropic SDK"""
+    prompt = _run_task(task_type, params)
+
+    # Call Bedrock API; concurrent tasks land in the same batcher window and share a call
+    response_text = batcher.submit(TASK_OPS_SYSTEM, prompt, max_tokens=1024).result()
 
+    return _finish_task(task_type, params, response_text)
+
+
+def _run_task(task_type: str, params: dict) -> str:
+    """Narrate, execute the task's tool, and build the Bedrock prompt from its result"""
     # NARRATIVE: Task evaluation
     terminal_logger.add_log(
         f"TaskOps evaluating remediation task: {task_type}",
@@ -53,45 +94,30 @@ def automate_task(task_type: str, params: dict):
     )
 
     # Execute the appropriate tool based on task type
-    execution_result = None
+    tool = TASK_TOOLS.get(task_type)
     try:
-        if task_type == 'vpn_reset':
-            execution_result = execute_vpn_reset(params.get('user', 'unknown'), params.get('vpn_server', 'vpn-01'))
-        elif task_type == 'verify_backup':
-            execution_result = verify_backup(host, params.get('backup_type', 'full'))
-        elif task_type == 'audit_licenses':
-            execution_result = audit_licenses(params.get('service', 'unknown'))
-        elif task_type == 'clear_disk_space':
-            execution_result = clear_disk_space(host, params.get('target_gb', 10))
-        elif task_type == 'restart_service':
-            execution_result = restart_service(host, params.get('service_name', 'unknown'), verify_startup=True)
-        else:
+        if tool is None:
             execution_result = {"error": f"Unknown task type: {task_type}"}
+        else:
+            execution_result = tool(params)
     except Exception as e:
         execution_result = {"error": str(e)}
 
-    prompt = f"""Execute this task: {task_type}
-Parameters: {json.dumps(params, indent=2)}
+    return f"""Execute this task: {task_type}
+Parameters: {_dump(params)}
 
 Execution results:
-{json.dumps(execution_result, indent=2)}
+{_dump(execution_result)}"""
 
-Based on the execution results, provide:
-1. Task completion status
-2. Any issues encountered
-3. Recommendations for optimization"""
 
-    # Call Bedrock API
-    response = client.messages.create(
-        model=os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514"),
-        max_tokens=1024,
-        system=TASK_OPS_SYSTEM_PROMPT,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
-    )
+def _dump(value) -> str:
+    """JSON for the prompt, rendered with orjson (indented only when TASK_OPS_PRETTY_PROMPTS is set)"""
+    return orjson.dumps(value, option=_DUMP_OPTION, default=str).decode()
 
-    response_text = response.content[0].text
+
+def _finish_task(task_type: str, params: dict, response_text: str) -> str:
+    """Log completion, store the execution and return the response text"""
+    host = params.get('host', 'unknown')
 
     # NARRATIVE: Task execution complete
     terminal_logger.add_log(
@@ -1,14 +1,33 @@
-import json
 import boto3
+import orjson
+import reprlib
 from agents.orchestrator import orchestrator
-from data.models import Alert, Metric, Severity, AlertStatus
-from datetime import datetime
+from aws.parsers import parse_alerts, parse_metrics
+
+# Response bodies carry at most this many characters of analysis (Lambda payload limits)
+ANALYSIS_MAX_CHARS = 1000
+
+# Bounded repr: nested results are abbreviated while rendering instead of being
+# stringified in full and then sliced
+_ANALYSIS_REPR = reprlib.Repr()
+_ANALYSIS_REPR.maxlevel = 4
+_ANALYSIS_REPR.maxdict = _ANALYSIS_REPR.maxlist = _ANALYSIS_REPR.maxtuple = 20
+_ANALYSIS_REPR.maxstring = _ANALYSIS_REPR.maxother = ANALYSIS_MAX_CHARS
+
+def _truncate_repr(obj, limit=ANALYSIS_MAX_CHARS):
+    """First `limit` characters of obj's text form, without rendering all of a large result"""
+    if isinstance(obj, str):
+        return obj[:limit]
+    return _ANALYSIS_REPR.repr(obj)[:limit]
 
 def lambda_handler(event, context):
     """AWS Lambda entry point for OpsForge AI"""
     
     try:
-        # Parse event
+        # Parse event (API Gateway proxy events carry the payload as a JSON body string)
+        body = event.get('body')
+        if isinstance(body, (str, bytes)):
+            event = orjson.loads(body)
         event_type = event.get('type')
         
         if event_type == 'alerts':
@@ -30,7 +49,7 @@ def handle_alerts(alert_data):
     
     return success_response({
         'incident_type': 'alert_correlation',
-        'analysis': str(result)[:1000]  # Truncate for Lambda limits
+        'analysis': _truncate_repr(result)
     })
 
 def handle_metrics(metric_data):
@@ -42,7 +61,7 @@ def handle_metrics(metric_data):
     
     return success_response({
         'incident_type': 'prediction',
-        'analysis': str(result)[:1000]
+        'analysis': _truncate_repr(result)
     })
 
 def handle_incident(alert_data, metric_data):
@@ -54,51 +73,19 @@ def handle_incident(alert_data, metric_data):
     
     return success_response({
         'incident_type': 'full_response',
-        'analysis': str(result)[:1000]
+        'analysis': _truncate_repr(result)
     })
 
-def parse_alerts(data):
-    """Parse alert JSON to Alert objects"""
-    return [
-        Alert(
-            alert_id=a.get('alert_id'),
-            title=a.get('title'),
-            description=a.get('description', ''),
-            severity=Severity(a.get('severity', 'medium')),
-            source=a.get('source', 'unknown'),
-            host=a.get('host'),
-            timestamp=datetime.fromisoformat(a.get('timestamp')),
-            status=AlertStatus(a.get('status', 'open')),
-            tags=a.get('tags', []),
-            metadata=a.get('metadata', {})
-        )
-        for a in data
-    ]
-
-def parse_metrics(data):
-    """Parse metric JSON to Metric objects"""
-    return [
-        Metric(
-            metric_id=m.get('metric_id'),
-            host=m.get('host'),
-            metric_name=m.get('metric_name'),
-            value=float(m.get('value')),
-            timestamp=datetime.fromisoformat(m.get('timestamp')),
-            unit=m.get('unit', 'percent')
-        )
-        for m in data
-    ]
-
 def success_response(data):
     return {
         'statusCode': 200,
-        'body': json.dumps(data),
+        'body': orjson.dumps(data).decode(),
         'headers': {'Content-Type': 'application/json'}
     }
 
 def error_response(error):
     return {
         'statusCode': 500,
-        'body': json.dumps({'error': error}),
+        'body': orjson.dumps({'error': error}).decode(),
         'headers': {'Content-Type': 'application/json'}
     }
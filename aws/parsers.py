@@ -0,0 +1,45 @@
+"""Alert/Metric payload parsing for the Lambda handlers
+
+Kept separate from lambda_handler so the per-event parsing path is a small,
+fully annotated module. The per-record work already runs in pydantic-core's
+compiled validators; the Lambda build ships this file as plain Python.
+"""
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter
+
+from config.isotime import parse_iso
+from data.models import Alert, Metric
+
+# Built once: pydantic-core validates a whole list in one call instead of one
+# Python-level constructor call per record
+_ALERT_LIST: TypeAdapter[List[Alert]] = TypeAdapter(List[Alert])
+_METRIC_LIST: TypeAdapter[List[Metric]] = TypeAdapter(List[Metric])
+
+# Lambda payload defaults for fields the models require
+_ALERT_DEFAULTS: Dict[str, Any] = {'description': '', 'severity': 'medium', 'source': 'unknown'}
+
+
+def _with_timestamp(record: Dict[str, Any]) -> Dict[str, Any]:
+    """record with an ISO-8601 'timestamp' string parsed by parse_iso (ciso8601 when installed)
+
+    Records without a string timestamp, or with one parse_iso rejects, are returned
+    unchanged for pydantic to validate.
+    """
+    ts = record.get('timestamp')
+    if isinstance(ts, str):
+        try:
+            return {**record, 'timestamp': parse_iso(ts)}
+        except ValueError:
+            pass
+    return record
+
+
+def parse_alerts(data: List[Dict[str, Any]]) -> List[Alert]:
+    """Parse alert JSON to Alert objects"""
+    return _ALERT_LIST.validate_python([_with_timestamp({**_ALERT_DEFAULTS, **a}) for a in data])
+
+
+def parse_metrics(data: List[Dict[str, Any]]) -> List[Metric]:
+    """Parse metric JSON to Metric objects"""
+    return _METRIC_LIST.validate_python([_with_timestamp(m) for m in data])
@@ -1,11 +1,22 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 import asyncio
+import hashlib
+import itertools
+import logging
+import orjson
 import os
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from config.knowledge_base import kb
+from operator import itemgetter
+from config.knowledge_base import kb, alert_correlation_confidence
 from config.action_executor import executor
+from config.terminal_logger import terminal_logger
+from config.isotime import parse_iso
 from config.text_formatter import (
     format_incident_title,
     format_root_cause_analysis,
@@ -17,6 +28,17 @@ from config.text_formatter import (
 )
 from live_data_generator import live_generator
 
+# Request tracing is debug-level; set OPSFORGE_LOG_LEVEL=DEBUG to see it
+log = logging.getLogger("opsforge.api")
+log.setLevel(os.getenv("OPSFORGE_LOG_LEVEL", "WARNING").upper())
+# Nothing configures the root logger (uvicorn only sets up its own loggers), so the API
+# logger gets its own stderr handler; otherwise records below WARNING are never shown
+if not log.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    log.addHandler(_log_handler)
+    log.propagate = False
+
 # Modern lifespan context manager (replaces deprecated @app.on_event)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -26,7 +48,44 @@ async def lifespan(app: FastAPI):
     # Shutdown: Stop the live data generator
     live_generator.stop()
 
-app = FastAPI(lifespan=lifespan)
+def _orjson_default(obj):
+    """Encode the few non-native types found in stored KB records (models, sets, deques)"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset, tuple, deque)):
+        return list(obj)
+    return str(obj)
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder
+
+    Large read-only endpoints return this directly, which skips FastAPI's
+    jsonable_encoder walk; orjson handles datetimes and enums natively.
+    """
+
+    def render(self, content) -> bytes:
+        return _dumps(content)
+
+def _dumps(content) -> bytes:
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+def _snapshot(payload):
+    """Encode a polled payload once: (body bytes, weak ETag of those bytes)"""
+    body = _dumps(payload)
+    return body, f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def _snapshot_response(request: Request, snapshot) -> Response:
+    """304 when the client already holds this snapshot, else the encoded body with its ETag"""
+    body, etag = snapshot
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+app = FastAPI(lifespan=lifespan, default_response_class=OrjsonResponse)
 
 # Get CORS origin from environment variable, fallback to localhost for development
 cors_origin = os.getenv("CORS_ORIGIN", "http://localhost:5173")
@@ -41,76 +100,80 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Incident, incident detail and audit-log payloads are repetitive JSON; compress
+# anything over 1KB for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # FIX: Add state tracking to prevent concurrent issues
 api_state = {
-    "last_metrics_snapshot": None,
-    "metrics_update_lock": asyncio.Lock()
+    "last_metrics_snapshot": None
 }
 
 @app.get("/api/metrics")
-async def get_metrics():
+async def get_metrics(request: Request):
     """FIX: Return consistent metrics snapshot"""
     try:
-        # Use the lock to ensure we get a consistent snapshot
-        async with api_state["metrics_update_lock"]:
-            # Return a copy to prevent external modification
-            metrics_snapshot = dict(live_generator.metrics_cache)
-            api_state["last_metrics_snapshot"] = metrics_snapshot
-        print(f"[API] /metrics called - returning: {metrics_snapshot}")
-        return metrics_snapshot
+        # Return a copy to prevent external modification. dict() copies in one C call
+        # with no await in between, so the snapshot is consistent without a lock.
+        metrics_snapshot = dict(live_generator.metrics_cache)
+        api_state["last_metrics_snapshot"] = metrics_snapshot
+        log.debug("/metrics called - returning: %s", metrics_snapshot)
+        return _snapshot_response(request, _snapshot(metrics_snapshot))
     except Exception as e:
-        print(f"[ERROR] Failed to fetch metrics: {e}")
+        log.error("Failed to fetch metrics: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch metrics: {str(e)}")
 
+# Read endpoints below are plain `def`: they do no I/O, so FastAPI runs them in its
+# threadpool and a slow incident/audit build does not stall the event loop (and the
+# live generator) for other requests. /api/metrics stays async; it is a dict copy.
+
+# Dashboard polls /api/agents continuously; reuse the last result while no action
+# has been recorded. The TTL only bounds how stale the relative "lastAction" text gets.
+AGENTS_CACHE_TTL_SECONDS = 1.0
+_agents_cache = {"key": None, "at": 0.0, "snapshot": None}
+
 @app.get("/api/agents")
-async def get_agents():
+def get_agents(request: Request):
     """FIX: Improved agent stats with proper action counting"""
     try:
-        print(f"[API] /agents called - recent_actions: {len(live_generator.recent_actions)}, incidents: {len(kb.incident_memory)}")
+        log.debug("/agents called - recent_actions: %d, incidents: %d", len(live_generator.recent_actions), len(kb.incident_memory))
+
+        cache_key = kb.agents_version
+        checked_at = time.monotonic()
+        if _agents_cache["key"] == cache_key and checked_at - _agents_cache["at"] < AGENTS_CACHE_TTL_SECONDS:
+            return _snapshot_response(request, _agents_cache["snapshot"])
 
         agents = []
         agent_names = ['AlertOps', 'PredictiveOps', 'PatchOps', 'TaskOps', 'Orchestrator']
 
+        # FIX: Count from incident_actions only (single authoritative source)
+        # This prevents double-counting actions that appear in both recent_actions and incident_actions
+        # The KB indexes incident actions by agent as they are written, so this is one lookup per agent
+        action_counts = {}
+        latest_action_times = {}
         for agent_name in agent_names:
-            try:
-                # FIX: Count from incident_actions only (single authoritative source)
-                # This prevents double-counting actions that appear in both recent_actions and incident_actions
-                incident_action_count = 0
-                latest_incident_action_time = None
-                latest_incident_action = None
-
-                for incident in kb.incident_memory.values():
-                    incident_actions = incident.get('incident_actions', [])
-                    for action in incident_actions:
-                        if action.get('agent') == agent_name:
-                            incident_action_count += 1
-                            action_timestamp = action.get('timestamp')
-                            if action_timestamp:
-                                if latest_incident_action_time is None or action_timestamp > latest_incident_action_time:
-                                    latest_incident_action_time = action_timestamp
-                                    latest_incident_action = action
+            entries = kb.get_agent_actions(agent_name)
+            action_counts[agent_name] = len(entries)
+            latest_action_times[agent_name] = (entries[-1][0] or None) if entries else None
 
+        now = datetime.now()
+        for agent_name in agent_names:
+            try:
                 # Use incident_actions as the single source of truth
-                total_action_count = incident_action_count
+                total_action_count = action_counts[agent_name]
 
                 # Get last action time from incident_actions
-                last_action_time = latest_incident_action_time
+                last_action_time = latest_action_times[agent_name]
 
                 # Format last action time
                 last_action_str = "N/A"
                 last_action_iso = None
                 if last_action_time:
                     try:
-                        # Normalize integer timestamps from KnowledgeBase to datetime
-                        if isinstance(last_action_time, (int, float)):
-                            from datetime import datetime as dt
-                            last_action_time = dt.fromtimestamp(last_action_time)
-
-                        last_action_str = live_generator._get_relative_time(last_action_time)
-                        if isinstance(last_action_time, str):
-                            last_action_iso = last_action_time
-                        else:
-                            last_action_iso = last_action_time.isoformat()
+                        # KnowledgeBase action timestamps are always int epoch seconds
+                        last_action_time = datetime.fromtimestamp(last_action_time)
+                        last_action_str = live_generator._get_relative_time(last_action_time, now)
+                        last_action_iso = last_action_time.isoformat()
                     except:
                         last_action_str = "N/A"
 
@@ -123,9 +186,7 @@ async def get_agents():
                 })
 
             except Exception as e:
-                print(f"[ERROR] Error processing agent {agent_name}: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Error processing agent %s: %s", agent_name, e)
                 # Add agent with default values to prevent empty response
                 agents.append({
                     "name": agent_name,
@@ -135,29 +196,53 @@ async def get_agents():
                     "lastActionTime": None
                 })
 
-        print(f"[API] /agents returning {len(agents)} agents")
-        return agents
+        snapshot = _snapshot(agents)
+        _agents_cache.update(key=cache_key, at=checked_at, snapshot=snapshot)
+        log.debug("/agents returning %d agents", len(agents))
+        return _snapshot_response(request, snapshot)
     except Exception as e:
-        print(f"[ERROR] Failed to fetch agents: {e}")
+        log.error("Failed to fetch agents: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch agents: {str(e)}")
 
 
+# Incident processing_state -> status shown in the dashboard
+STATE_TO_STATUS = {
+    'created': "investigating",
+    'analyzing': "investigating",
+    'remediation_in_progress': "in_progress",
+    'resolved': "resolved",
+    'failed': "failed",
+}
+
 @app.get("/api/incidents")
-async def get_incidents():
+def get_incidents():
     """FIX: Return incidents with proper state handling"""
     try:
-        print(f"[API] /incidents called - KB has {len(kb.incident_memory)} incidents: {list(kb.incident_memory.keys())}")
+        log.debug("/incidents called - KB has %d incidents", len(kb.incident_memory))
 
         incidents = []
-        incident_items = list(kb.incident_memory.items())
-
-        for inc_id, inc in incident_items[-20:]:
+        # Newest 20 incidents straight off the end of the insertion-ordered dict. The KB
+        # inserts incidents as they are created, so this is already newest-first and the
+        # other incidents are never touched.
+        recent_ids = list(itertools.islice(reversed(kb.incident_memory), 20))
+        now = datetime.now()
+        # Checked once so the per-incident trace costs nothing at the default WARNING level
+        trace = log.isEnabledFor(logging.DEBUG)
+
+        for inc_id in recent_ids:
+            inc = kb.incident_memory.get(inc_id)
+            if inc is None:
+                continue
             try:
-                print(f"  Processing incident {inc_id}: state={inc.get('processing_state', 'unknown')}, root_cause={inc.get('root_cause', 'N/A')[:50]}")
+                if trace:
+                    log.debug("  Processing incident %s: state=%s", inc_id, inc.get('processing_state', 'unknown'))
 
-                created_time = live_generator.incident_times.get(inc_id, datetime.now())
+                created_time = live_generator.incident_times.get(inc_id)
+                if created_time is None:
+                    # Not generated locally: fall back to the KB's creation stamp so order holds
+                    created_time = datetime.fromtimestamp(inc['timestamp']) if inc.get('timestamp') else now
 
-                # Get alerts (now stored as full details)
+                # Get alerts (stored as dicts; the KB normalizes them on write)
                 alerts = inc.get('alerts', [])
 
                 # Handle processing incidents with proper state
@@ -170,35 +255,15 @@ async def get_incidents():
                 else:
                     # Extract title from first alert
                     if alerts and len(alerts) > 0:
-                        if isinstance(alerts[0], dict):
-                            title = format_incident_title(alerts[0].get('title', 'System Incident'))
-                        else:
-                            # Fallback for old format
-                            alert_str = str(alerts[0])
-                            if "title='" in alert_str:
-                                raw_title = alert_str.split("title='")[1].split("'")[0]
-                            elif 'title="' in alert_str:
-                                raw_title = alert_str.split('title="')[1].split('"')[0]
-                            else:
-                                raw_title = "System Incident"
-                            title = format_incident_title(raw_title)
+                        title = format_incident_title(alerts[0].get('title', 'System Incident'))
                     else:
                         title = "System Incident"
 
                 # FIX: Use processing_state for accurate status
-                if processing_state == 'created':
-                    status = "investigating"
-                elif processing_state == 'analyzing':
-                    status = "investigating"
-                elif processing_state == 'remediation_in_progress':
-                    status = "in_progress"
-                elif processing_state == 'resolved':
-                    status = "resolved"
-                elif processing_state == 'failed':
-                    status = "failed"
-                else:
+                status = STATE_TO_STATUS.get(processing_state)
+                if status is None:
                     # Fallback: use time-based logic
-                    age_seconds = (datetime.now() - created_time).total_seconds()
+                    age_seconds = (now - created_time).total_seconds()
                     age_minutes = age_seconds / 60
 
                     if age_minutes > 10:
@@ -222,18 +287,11 @@ async def get_incidents():
                 # Get severity with proper fallback
                 severity = "medium"
                 if alerts:
-                    if isinstance(alerts[0], dict):
-                        severity = alerts[0].get('severity', 'medium')
-                    else:
-                        alert_str = str(alerts[0])
-                        if "severity='critical'" in alert_str or 'severity="critical"' in alert_str:
-                            severity = "critical"
-                        elif "severity='high'" in alert_str or 'severity="high"' in alert_str:
-                            severity = "high"
+                    severity = alerts[0].get('severity', 'medium')
 
                 # Calculate time properly
                 created_str = format_datetime(created_time)
-                relative_time = live_generator._get_relative_time(created_time)
+                relative_time = live_generator._get_relative_time(created_time, now)
 
                 incidents.append({
                     "id": inc_id,
@@ -249,22 +307,28 @@ async def get_incidents():
                 })
 
             except Exception as e:
-                print(f"[ERROR] Error processing incident {inc_id}: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Error processing incident %s: %s", inc_id, e)
                 continue
 
-        # FIX: Sort by creation time, newest first
-        incidents.sort(key=lambda x: x['createdAt'], reverse=True)
-
-        print(f"[API] /incidents returning {len(incidents)} incidents")
-        return incidents
+        log.debug("/incidents returning %d incidents", len(incidents))
+        return OrjsonResponse(incidents)
     except Exception as e:
-        print(f"[ERROR] Failed to fetch incidents: {e}")
+        log.error("Failed to fetch incidents: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch incidents: {str(e)}")
 
+def _timeline_sort_key(timestamp) -> float:
+    """Epoch seconds for a timeline timestamp (int, datetime or ISO string); unknowns sort last"""
+    try:
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
+        if isinstance(timestamp, str):
+            timestamp = parse_iso(timestamp)
+        return timestamp.timestamp()
+    except (ValueError, AttributeError, TypeError, OverflowError, OSError):
+        return float('inf')
+
 @app.get("/api/incidents/{incident_id}")
-async def get_incident_detail(incident_id: str):
+def get_incident_detail(incident_id: str):
     """FIX: Get incident details with complete structure for CSV export"""
     incident = kb.get_incident(incident_id)
     if not incident:
@@ -275,8 +339,7 @@ async def get_incident_detail(incident_id: str):
     if not created_time:
         created_time = live_generator.incident_times.get(incident_id, datetime.now())
     elif isinstance(created_time, str):
-        from datetime import datetime as dt
-        created_time = dt.fromisoformat(created_time)
+        created_time = datetime.fromisoformat(created_time)
 
     # Get alerts
     alerts = incident.get('alerts', [])
@@ -285,34 +348,27 @@ async def get_incident_detail(incident_id: str):
     title = "System Incident"
     severity = "medium"
     if alerts and len(alerts) > 0:
-        if isinstance(alerts[0], dict):
-            title = format_incident_title(alerts[0].get('title', 'System Incident'))
-            severity = alerts[0].get('severity', 'medium')
-        else:
-            # Fallback for old format
-            alert_str = str(alerts[0])
-            if "title='" in alert_str:
-                raw_title = alert_str.split("title='")[1].split("'")[0]
-                title = format_incident_title(raw_title)
-            if "severity='critical'" in alert_str or 'severity="critical"' in alert_str:
-                severity = "critical"
-            elif "severity='high'" in alert_str or 'severity="high"' in alert_str:
-                severity = "high"
+        title = format_incident_title(alerts[0].get('title', 'System Incident'))
+        severity = alerts[0].get('severity', 'medium')
+
+    # One pass over the alerts collects their hosts (affected components fallback)
+    # and their raw (sort key, timestamp, event) timeline rows
+    alert_hosts = set()
+    raw_timeline = []
+    for alert in alerts:
+        host = alert.get('host')
+        if host:
+            alert_hosts.add(host)
+        alert_timestamp = alert.get('timestamp', 'N/A')
+        raw_timeline.append((
+            _timeline_sort_key(alert_timestamp),
+            alert_timestamp,
+            f"Alert: {alert.get('title', 'Unknown')}"
+        ))
 
     # Get processing state and derive status
     processing_state = incident.get('processing_state', 'created')
-    if processing_state == 'created':
-        status = "investigating"
-    elif processing_state == 'analyzing':
-        status = "investigating"
-    elif processing_state == 'remediation_in_progress':
-        status = "in_progress"
-    elif processing_state == 'resolved':
-        status = "resolved"
-    elif processing_state == 'failed':
-        status = "failed"
-    else:
-        status = "investigating"
+    status = STATE_TO_STATUS.get(processing_state, "investigating")
 
     # Calculate timestamps
     created_at = created_time.isoformat()
@@ -341,9 +397,8 @@ async def get_incident_detail(incident_id: str):
                         default=None
                     )
                 if candidate_ts is not None:
-                    from datetime import datetime as dt
                     # candidate_ts is stored as Unix epoch seconds (int)
-                    resolved_time = dt.fromtimestamp(candidate_ts)
+                    resolved_time = datetime.fromtimestamp(candidate_ts)
             except Exception:
                 resolved_time = None
 
@@ -368,41 +423,21 @@ async def get_incident_detail(incident_id: str):
         root_cause_summary = format_llm_synthesis(str(root_cause), max_length=200)
 
     # Derive affected components with sensible fallback
-    affected_components = incident.get('affected_components')
-    if not affected_components:
-        # Fallback: use unique hosts from alerts as components
-        hosts = set()
-        for alert in alerts:
-            if isinstance(alert, dict):
-                host = alert.get('host')
-                if host:
-                    hosts.add(host)
-        affected_components = sorted(hosts) if hosts else []
-
-    # Derive correlation score / confidence if not already stored
+    # (kb.store_incident records them; older records fall back to the alert hosts,
+    # computed for this response only)
+    affected_components = incident.get('affected_components') or sorted(alert_hosts)
+
+    # Correlation score / confidence are stored with the incident (kb.store_incident) and
+    # refreshed when analysis completes; a record without them is scored for this
+    # response only - this handler runs in the threadpool and never writes to the KB
     correlation_score = incident.get('correlation_score')
     confidence_score = incident.get('confidence')
-    if correlation_score is None or confidence_score is None:
-        try:
-            from agents.strands_tools import correlate_alerts
-            alert_dicts = []
-            for alert in alerts:
-                if isinstance(alert, dict):
-                    alert_dicts.append({
-                        "alert_id": alert.get("alert_id"),
-                        "title": alert.get("title", ""),
-                        "host": alert.get("host", ""),
-                        "timestamp": alert.get("timestamp"),
-                        "severity": alert.get("severity", "medium"),
-                    })
-            if alert_dicts:
-                corr_result = correlate_alerts(alert_dicts)
-                if correlation_score is None:
-                    correlation_score = corr_result.get("confidence")
-                if confidence_score is None:
-                    confidence_score = corr_result.get("confidence")
-        except Exception:
-            pass
+    if (correlation_score is None or confidence_score is None) and alerts:
+        computed = alert_correlation_confidence(alerts)
+        if correlation_score is None:
+            correlation_score = computed
+        if confidence_score is None:
+            confidence_score = computed
 
     # Format why-trace analysis
     formatted_why_trace = {
@@ -416,79 +451,41 @@ async def get_incident_detail(incident_id: str):
         ]
     }
 
-    # Build timeline with proper formatting
-    timeline = []
-    
-    # Add alert timeline events
-    alerts = incident.get('alerts', [])
-    for alert in alerts:
-        if isinstance(alert, dict):
-            alert_timestamp = alert.get('timestamp', 'N/A')
-            formatted_alert_time = format_datetime(alert_timestamp, 'short') if alert_timestamp != 'N/A' else 'N/A'
-            timeline.append({
-                "time": formatted_alert_time,
-                "event": format_timeline_event(f"Alert: {alert.get('title', 'Unknown')}")
-            })
-
+    # Build timeline with proper formatting (alert rows were collected above)
     # Add action timeline events
     incident_actions = incident.get('incident_actions', [])
     for action in incident_actions:
         action_timestamp = action.get('timestamp')
         if action_timestamp:
-            formatted_time = "N/A"
-            try:
-                if isinstance(action_timestamp, int):
-                    from datetime import datetime as dt
-                    dt_obj = dt.fromtimestamp(action_timestamp)
-                    formatted_time = format_datetime(dt_obj, 'short')
-                else:
-                    formatted_time = format_datetime(action_timestamp, 'short')
-            except:
-                formatted_time = str(action_timestamp)
-
-            timeline.append({
-                "time": formatted_time,
-                "event": format_timeline_event(f"{action.get('agent', 'Unknown')} {action.get('action_type', action.get('type', 'action'))}")
-            })
-
-    # Sort timeline by time
-    timeline.sort(key=lambda x: x['time'])
-
-    # Build audit logs
-    audit_logs = []
-    for i, action in enumerate(incident_actions):
-        # FIX: Use 'action_type' field with proper fallback
-        action_type = action.get('action_type', action.get('type', 'Unknown'))
-        formatted_action = humanize_action_type(action_type)
-
-        status = action.get('status', 'unknown')
-        formatted_status = humanize_status(status)
-
-        # Format timestamp
-        action_timestamp = action.get('timestamp')
-        formatted_time = "N/A"
-        if action_timestamp:
+            raw_timeline.append((
+                _timeline_sort_key(action_timestamp),
+                action_timestamp,
+                f"{action.get('agent', 'Unknown')} {action.get('action_type', action.get('type', 'action'))}"
+            ))
+
+    # Sort on the real timestamps (formatted strings do not sort chronologically),
+    # then format the ordered rows
+    raw_timeline.sort(key=itemgetter(0))
+    timeline = []
+    for _, event_timestamp, event in raw_timeline:
+        if event_timestamp == 'N/A':
+            formatted_time = 'N/A'
+        else:
             try:
-                if isinstance(action_timestamp, int):
-                    from datetime import datetime as dt
-                    dt_obj = dt.fromtimestamp(action_timestamp)
-                    formatted_time = format_datetime(dt_obj, 'full')
-                else:
-                    formatted_time = format_datetime(action_timestamp, 'full')
+                # Int KB timestamps are formatted (and cached) directly as epoch seconds
+                formatted_time = format_datetime(event_timestamp, 'short')
             except:
-                formatted_time = str(action_timestamp)
-
-        audit_logs.append({
-            "id": action.get('action_id', f"ACT-{i:03d}"),
-            "agent": action.get('agent', 'Unknown'),
-            "action": formatted_action,
-            "status": formatted_status.lower(),
+                formatted_time = str(event_timestamp)
+        timeline.append({
             "time": formatted_time,
-            "description": action.get('description', 'No description')
+            "event": format_timeline_event(event)
         })
 
+    # Build audit logs
+    audit_logs = [_build_audit_row(action, i) for i, action in enumerate(incident_actions)]
+
     # Return comprehensive structure for CSV export and detail view
-    return {
+    return OrjsonResponse({
         "id": incident_id,
         "title": title,
         "severity": severity,
@@ -509,13 +506,16 @@ async def get_incident_detail(incident_id: str):
         "audit_logs": audit_logs,
         # Keep original incident data for any other needs
         "details": incident
-    }
+    })
 
 @app.get("/api/actions/recent")
-async def get_recent_actions():
+def get_recent_actions():
     """Get recent actions with proper formatting"""
     actions = []
-    for action in live_generator.recent_actions[:10]:
+    now = datetime.now()
+    # Snapshot first: this handler runs in the threadpool while the generator
+    # keeps adding to the deque on the event loop
+    for action in list(itertools.islice(live_generator.recent_actions, 10)):
         try:
             # Format the action text
             action_text = action.get('action', 'Unknown action')
@@ -527,17 +527,24 @@ async def get_recent_actions():
             actions.append({
                 "agent": action.get('agent', 'Unknown'),
                 "action": action_text,
-                "time": live_generator._get_relative_time(action.get('timestamp', datetime.now()))
+                "time": live_generator._get_relative_time(action.get('timestamp', now), now)
             })
         except Exception as e:
-            print(f"[ERROR] Error processing action: {e}")
+            log.error("Error processing action: %s", e)
             continue
     return actions
 
+# Encoded patch list, rebuilt only when live_generator.patches_version changes
+_patches_cache = {"version": None, "snapshot": None}
+
 @app.get("/api/patches")
-async def get_patches():
+def get_patches(request: Request):
     """Get patch information"""
-    return [
+    version = live_generator.patches_version
+    if _patches_cache["version"] == version:
+        return _snapshot_response(request, _patches_cache["snapshot"])
+
+    patches = [
         {
             "id": p['id'],
             "name": p['name'],
@@ -555,11 +562,14 @@ async def get_patches():
         }
         for p in live_generator.patches
     ]
+    snapshot = _snapshot(patches)
+    _patches_cache.update(version=version, snapshot=snapshot)
+    return _snapshot_response(request, snapshot)
 
 @app.get("/api/patches/{plan_id}")
-async def get_patch_detail(plan_id: str):
+def get_patch_detail(plan_id: str):
     """Get detailed patch information"""
-    patch = next((p for p in live_generator.patches if p['id'] == plan_id), None)
+    patch = live_generator.patches_by_id.get(plan_id)
     if not patch:
         return {"error": "Not found"}
 
@@ -591,9 +601,9 @@ async def get_patch_detail(plan_id: str):
     }
 
 @app.get("/api/forecasts")
-async def get_forecasts():
+def get_forecasts(request: Request):
     """Return real-time forecast data from PredictiveOps analysis"""
-    return live_generator.forecast_cache
+    return _snapshot_response(request, _snapshot(live_generator.forecast_cache))
 
 def extract_action_target(action: dict) -> str:
     """
@@ -642,8 +652,45 @@ def extract_action_target(action: dict) -> str:
     return "System"
 
 
+def _build_audit_row(action, idx, incident_id=None, _ha=humanize_action_type, _hs=humanize_status,
+                     _fd=format_datetime, _target=extract_action_target):
+    """Format one incident action as an audit log row
+
+    Rows for /api/audit-logs (incident_id given) carry the target and incident id;
+    rows for the incident detail view carry the description instead. Formatters are
+    bound as defaults so the per-row calls are local lookups.
+    """
+    # FIX: Use 'action_type' field with proper fallback
+    action_type = action.get('action_type', action.get('type', 'Unknown'))
+
+    # Format timestamp
+    action_timestamp = action.get('timestamp')
+    formatted_time = "N/A"
+    if action_timestamp:
+        try:
+            formatted_time = _fd(action_timestamp, 'full')
+        except:
+            formatted_time = str(action_timestamp)
+
+    row = {
+        "id": action.get('action_id', f"ACT-{idx:03d}"),
+        "agent": action.get('agent', 'Unknown'),
+        "action": _ha(action_type),
+    }
+    if incident_id is not None:
+        # FIX: Extract meaningful target instead of hardcoded "N/A"
+        row["target"] = _target(action)
+    row["status"] = _hs(action.get('status', 'unknown')).lower()
+    row["time"] = formatted_time
+    if incident_id is not None:
+        row["incident_id"] = incident_id
+    else:
+        row["description"] = action.get('description', 'No description')
+    return row
+
+
 @app.get("/api/audit-logs")
-async def get_audit_logs(incident_id: str = None):
+def get_audit_logs(incident_id: str = None):
     """
     Return audit logs, optionally filtered by incident
     If incident_id provided: return incident-specific actions
@@ -660,93 +707,20 @@ async def get_audit_logs(incident_id: str = None):
         # Get incident-specific actions
         incident_actions = incident.get('incident_actions', [])
 
-        for i, action in enumerate(incident_actions):
-            # Format action type and status
-            action_type = action.get('action_type', action.get('type', 'Unknown'))
-            formatted_action = humanize_action_type(action_type)
-
-            status = action.get('status', 'unknown')
-            formatted_status = humanize_status(status)
-
-            # Format timestamp
-            action_timestamp = action.get('timestamp')
-            formatted_time = "N/A"
-            if action_timestamp:
-                try:
-                    if isinstance(action_timestamp, int):
-                        from datetime import datetime as dt
-                        dt_obj = dt.fromtimestamp(action_timestamp)
-                        formatted_time = format_datetime(dt_obj, 'full')
-                    else:
-                        formatted_time = format_datetime(action_timestamp, 'full')
-                except:
-                    formatted_time = str(action_timestamp)
-
-            # FIX: Extract meaningful target instead of hardcoded "N/A"
-            target = extract_action_target(action)
-
-            logs.append({
-                "id": action.get('action_id', f"ACT-{i:03d}"),
-                "agent": action.get('agent', 'Unknown'),
-                "action": formatted_action,
-                "target": target,
-                "status": formatted_status.lower(),
-                "time": formatted_time,
-                "incident_id": incident_id
-            })
+        logs = [_build_audit_row(action, i, incident_id) for i, action in enumerate(incident_actions)]
 
     else:
-        # Return ALL incident actions from all incidents (most recent 50)
-        all_incidents = list(kb.incident_memory.values())
-        all_incidents.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-
-        action_count = 0
-        for incident in all_incidents:
-            if action_count >= 50:
-                break
-
-            incident_id = incident.get('incident_id')
-            incident_actions = incident.get('incident_actions', [])
-            for action in incident_actions:
-                if action_count >= 50:
-                    break
-
-                # Format action type and status
-                action_type = action.get('action_type', action.get('type', 'Unknown'))
-                formatted_action = humanize_action_type(action_type)
-
-                status = action.get('status', 'unknown')
-                formatted_status = humanize_status(status)
-
-                # Format timestamp
-                action_timestamp = action.get('timestamp')
-                formatted_time = "N/A"
-                if action_timestamp:
-                    try:
-                        if isinstance(action_timestamp, int):
-                            from datetime import datetime as dt
-                            dt_obj = dt.fromtimestamp(action_timestamp)
-                            formatted_time = format_datetime(dt_obj, 'full')
-                        else:
-                            formatted_time = format_datetime(action_timestamp, 'full')
-                    except:
-                        formatted_time = str(action_timestamp)
-
-                # FIX: Extract meaningful target for global view too
-                target = extract_action_target(action)
-
-                logs.append({
-                    "id": action.get('action_id', f"ACT-{action_count:03d}"),
-                    "agent": action.get('agent', 'Unknown'),
-                    "action": formatted_action,
-                    "target": target,
-                    "status": formatted_status.lower(),
-                    "time": formatted_time,
-                    "incident_id": incident_id
-                })
-                action_count += 1
+        # Most recent 50 actions across all incidents, newest first, straight from the
+        # KB's global ring buffer (snapshotted: actions are written on other threads)
+        recent = list(itertools.islice(reversed(kb.recent_actions_global), 50))
+        logs = [
+            _build_audit_row(action, i, action_incident_id)
+            for i, (action_incident_id, action) in enumerate(recent)
+        ]
 
-    return logs[::-1]
+    # Reverse in place rather than returning a reversed copy
+    logs.reverse()
+    return OrjsonResponse(logs)
 
 @app.post("/api/kill-switch/toggle")
 async def toggle_kill_switch():
@@ -804,7 +778,6 @@ async def get_simulation_status():
 @app.post("/api/terminal-output-mode")
 async def set_terminal_output_mode(data: dict):
     """Change terminal output mode: full, selective, or none"""
-    from config.terminal_logger import terminal_logger
     mode = data.get("mode", "")
     if mode not in ["full", "selective", "none"]:
         return {"error": "Invalid mode. Must be 'full', 'selective', or 'none'"}
@@ -818,7 +791,6 @@ async def set_terminal_output_mode(data: dict):
 @app.get("/api/terminal-output-mode")
 async def get_terminal_output_mode():
     """Get current terminal output mode"""
-    from config.terminal_logger import terminal_logger
     return {
         "mode": terminal_logger.get_output_mode()
     }
@@ -826,7 +798,6 @@ async def get_terminal_output_mode():
 @app.get("/api/logs")
 async def get_logs(limit: int = 1000, log_type: str = None):
     """Get recent system logs for terminal viewer, optionally filtered by type"""
-    from config.terminal_logger import terminal_logger
     logs = terminal_logger.get_logs(limit=limit, log_type=log_type)
     return {
         "logs": logs,
@@ -837,7 +808,6 @@ async def get_logs(limit: int = 1000, log_type: str = None):
 @app.post("/api/logs/clear")
 async def clear_logs():
     """Clear all logs from the terminal logger buffer"""
-    from config.terminal_logger import terminal_logger
     terminal_logger.clear_logs()
     return {"status": "cleared"}
 
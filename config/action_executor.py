@@ -1,4 +1,8 @@
+import asyncio
+from collections import deque
+from threading import Lock
 from typing import Dict, List
+import os
 import time
 from config.knowledge_base import kb
 from config.terminal_logger import terminal_logger
@@ -10,7 +14,12 @@ class ActionExecutor:
 
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
-        self.execution_log = []
+        # Bounded: oldest results drop off instead of growing for the life of the process
+        self.execution_log = deque(maxlen=int(os.getenv("ACTION_LOG_MAX", "10000")))
+        # Same results keyed by action_id, for rollback lookups
+        self._actions_by_id = {}
+        # Actions run on worker threads (execute_action_async); keeps log and index in step
+        self._log_lock = Lock()
         self.current_incident_id = None  # PHASE 1: Track current incident
 
     def set_incident_context(self, incident_id: str) -> None:
@@ -19,6 +28,17 @@ class ActionExecutor:
 
     def execute_action(self, action: Dict, incident_id: str = None) -> Dict:
         """Execute single action with rollback capability"""
+        # The action's narrative lines (validate, execute, result) are published together
+        # when the block exits: one logger commit per action instead of one per line
+        with terminal_logger.batch():
+            return self._execute_action(action, incident_id)
+
+    async def execute_action_async(self, action: Dict, incident_id: str = None) -> Dict:
+        """execute_action for async callers: runs in a worker thread so the simulated
+        service waits (restart/clear cache) do not block the event loop"""
+        return await asyncio.to_thread(self.execute_action, action, incident_id)
+
+    def _execute_action(self, action: Dict, incident_id: str = None) -> Dict:
         action_type = action.get("type")
         params = action.get("params", {})
 
@@ -89,7 +109,7 @@ class ActionExecutor:
                 "TASKOPS"
             )
 
-        self.execution_log.append(result)
+        self._log_result(result)
 
         # PHASE 1: Link action to incident if available
         # PHASE 2 TASK 2.3: Create audit log entry
@@ -164,15 +184,23 @@ class ActionExecutor:
             "new_capacity": params.get("target")
         }
     
+    def _log_result(self, result: Dict) -> None:
+        """Append to the execution log, dropping the evicted entry from the id index"""
+        with self._log_lock:
+            if len(self.execution_log) == self.execution_log.maxlen:
+                self._actions_by_id.pop(self.execution_log[0]["action_id"], None)
+            self.execution_log.append(result)
+            self._actions_by_id[result["action_id"]] = result
+
     def rollback_action(self, action_id: str) -> Dict:
         """Rollback executed action"""
-        for action in self.execution_log:
-            if action["action_id"] == action_id:
-                return {
-                    "rollback_status": "completed",
-                    "original_action": action["type"],
-                    "rollback_time": "5s"
-                }
-        return {"rollback_status": "action_not_found"}
+        action = self._actions_by_id.get(action_id)
+        if action is None:
+            return {"rollback_status": "action_not_found"}
+        return {
+            "rollback_status": "completed",
+            "original_action": action["type"],
+            "rollback_time": "5s"
+        }
 
 executor = ActionExecutor(dry_run=False)
@@ -1,11 +1,19 @@
 """Intelligent agent selection based on incident characteristics"""
 
 from typing import List, Dict, Tuple, Optional
-from config.bedrock_client import BedrockClient
+from collections import OrderedDict
+from threading import Lock
+from config.bedrock_client import get_client
+import hashlib
 import os
 import json
+import re
 
-client = BedrockClient(region_name=os.getenv("AWS_REGION", "us-east-1"))
+# Reused for every LLM selection reply
+_JSON_DECODER = json.JSONDecoder()
+
+client = get_client()
+MODEL_ID = os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514")
 
 class AgentSelector:
     """Determines which agents are relevant for a given incident"""
@@ -34,36 +42,40 @@ class AgentSelector:
         }
     }
 
-    def __init__(self):
-        self.selection_cache = {}
+    # Upper bound on memoized LLM relevance scores (one entry per incident fingerprint)
+    SELECTION_CACHE_SIZE = 1024
 
-    def calculate_keyword_relevance(self, agent_name: str, alerts: List[Dict], metrics: List[Dict] = None) -> int:
-        """Calculate keyword-based relevance score (0-40 points)"""
-        if agent_name not in self.AGENT_CAPABILITIES:
+    def __init__(self):
+        self.selection_cache = OrderedDict()
+        self._cache_lock = Lock()
+
+    def calculate_keyword_relevance(self, agent_name: str, alerts: List[Dict], metrics: List[Dict] = None,
+                                    texts: Tuple[List[str], List[str]] = None) -> int:
+        """Calculate keyword-based relevance score (0-40 points)
+
+        Args:
+            texts: Optional (alert texts, metric names) from _lowered_texts, so callers scoring
+                several agents lower-case the incident once
+        """
+        pattern = _AGENT_KEYWORD_RE.get(agent_name)
+        if pattern is None:
             return 0
 
-        keywords = self.AGENT_CAPABILITIES[agent_name]["keywords"]
-        score = 0
+        alert_texts, metric_names = texts or self._lowered_texts(alerts, metrics)
 
-        # Check alert titles and descriptions
-        for alert in alerts:
-            text = f"{alert.get('title', '')} {alert.get('description', '')}".lower()
-            for keyword in keywords:
-                if keyword in text:
-                    score += 5
-                    break
-
-        # Check metric names if available
-        if metrics:
-            for metric in metrics[:10]:  # Sample first 10
-                metric_name = metric.get('metric_name', '').lower()
-                for keyword in keywords:
-                    if keyword in metric_name:
-                        score += 3
-                        break
+        # Check alert titles and descriptions, then metric names (one search per text)
+        score = 5 * sum(1 for text in alert_texts if pattern.search(text))
+        score += 3 * sum(1 for name in metric_names if pattern.search(name))
 
         return min(score, 40)
 
+    @staticmethod
+    def _lowered_texts(alerts: List[Dict], metrics: List[Dict] = None) -> Tuple[List[str], List[str]]:
+        """Lower-cased alert 'title description' strings and (first 10) metric names"""
+        alert_texts = [f"{alert.get('title', '')} {alert.get('description', '')}".lower() for alert in alerts]
+        metric_names = [metric.get('metric_name', '').lower() for metric in metrics[:10]] if metrics else []  # Sample first 10
+        return alert_texts, metric_names
+
     def select_agents_llm(self, alerts: List[Dict], metrics: List[Dict] = None) -> Dict[str, int]:
         """Use LLM to intelligently select agents with confidence scores"""
 
@@ -77,6 +89,13 @@ class AgentSelector:
         if metrics:
             metric_summary = f"\nMetrics: {len(metrics)} data points available"
 
+        # The prompt only sees the top alerts and the metric count; incidents that agree
+        # on those reuse the earlier LLM scores instead of another round-trip
+        fingerprint = self._incident_fingerprint(alert_summary, metric_summary)
+        cached = self._get_cached_scores(fingerprint)
+        if cached is not None:
+            return cached
+
         # Build prompt for agent selection
         prompt = f"""Analyze this IT incident and determine which specialist agents should handle it.
 
@@ -107,7 +126,7 @@ JSON only, no explanation:"""
 
         try:
             response = client.messages.create(
-                model=os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514"),
+                model=MODEL_ID,
                 max_tokens=256,
                 temperature=0.3,
                 system="You are an expert IT operations analyst. Return only valid JSON.",
@@ -117,17 +136,17 @@ JSON only, no explanation:"""
             response_text = response.content[0].text.strip()
 
             # Extract JSON from response
-            if "{" in response_text:
-                json_start = response_text.index("{")
-                json_end = response_text.rindex("}") + 1
-                json_str = response_text[json_start:json_end]
-                scores = json.loads(json_str)
+            json_start = response_text.find("{")
+            if json_start != -1:
+                # Decode the first complete object in place; trailing prose is ignored
+                scores, _ = _JSON_DECODER.raw_decode(response_text, json_start)
 
                 # Validate scores
                 validated = {}
                 for agent in ["AlertOps", "PredictiveOps", "PatchOps", "TaskOps"]:
                     validated[agent] = max(0, min(100, scores.get(agent, 0)))
 
+                self._cache_scores(fingerprint, validated)
                 return validated
 
         except Exception as e:
@@ -149,13 +168,27 @@ JSON only, no explanation:"""
         scores["PredictiveOps"] = 75 if metrics and len(metrics) > 10 else 30
 
         # Keyword-based scoring for specialized agents
-        scores["PatchOps"] = self.calculate_keyword_relevance("PatchOps", alerts, metrics)
-        scores["TaskOps"] = self.calculate_keyword_relevance("TaskOps", alerts, metrics)
+        texts = self._lowered_texts(alerts, metrics)
+        scores["PatchOps"] = self.calculate_keyword_relevance("PatchOps", alerts, metrics, texts)
+        scores["TaskOps"] = self.calculate_keyword_relevance("TaskOps", alerts, metrics, texts)
 
         return scores
 
     def select_agents(self, alerts: List[Dict], metrics: List[Dict] = None, threshold: int = 60) -> List[str]:
         """Select agents above relevance threshold with learned pattern integration"""
+        selected, _ = self.select_agents_with_keywords(alerts, metrics, threshold)
+        return selected
+
+    def select_agents_with_keywords(self, alerts: List[Dict], metrics: List[Dict] = None,
+                                    threshold: int = 60, use_llm: bool = True) -> Tuple[List[str], List[str]]:
+        """Select agents and return them with the keywords used for learned-pattern lookup
+
+        Args:
+            use_llm: False scores with the keyword heuristic only (no Bedrock call)
+
+        Returns:
+            (selected agents, keywords) so callers recording the selection don't re-extract keywords
+        """
 
         # Phase C: Check for learned patterns first
         keywords = self._extract_keywords(alerts)
@@ -164,10 +197,12 @@ JSON only, no explanation:"""
         if learned_suggestion:
             # Use learned pattern with high confidence
             if learned_suggestion["confidence"] >= 0.85:
-                return learned_suggestion["suggested_agents"]
+                return learned_suggestion["suggested_agents"], keywords
 
-        # Otherwise, use LLM/keyword selection
-        scores = self.select_agents_llm(alerts, metrics)
+        # Otherwise, use LLM/keyword selection (LLM scores are memoized per incident
+        # fingerprint); learned suggestions and the adaptive threshold are still
+        # evaluated live on every call.
+        scores = self.select_agents_llm(alerts, metrics) if use_llm else self._fallback_selection(alerts, metrics)
 
         # Adaptive thresholding based on historical outcomes (safe bounds)
         adjusted_threshold = self._adjust_threshold(keywords, threshold)
@@ -184,7 +219,25 @@ JSON only, no explanation:"""
         if len(selected) == 1:
             selected.append("AlertOps")
 
-        return selected
+        return selected, keywords
+
+    def _incident_fingerprint(self, alert_summary: str, metric_summary: str) -> bytes:
+        """Hash of exactly what the selection prompt sees, so equal fingerprints get equal scores"""
+        payload = json.dumps([alert_summary, metric_summary])
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def _get_cached_scores(self, signature: bytes) -> Optional[Dict[str, int]]:
+        with self._cache_lock:
+            scores = self.selection_cache.get(signature)
+            if scores is not None:
+                self.selection_cache.move_to_end(signature)
+            return scores
+
+    def _cache_scores(self, signature: bytes, scores: Dict[str, int]):
+        with self._cache_lock:
+            self.selection_cache[signature] = scores
+            if len(self.selection_cache) > self.SELECTION_CACHE_SIZE:
+                self.selection_cache.popitem(last=False)
 
     def _extract_keywords(self, alerts: List[Dict]) -> List[str]:
         """Extract keywords from alert titles"""
@@ -227,5 +280,12 @@ JSON only, no explanation:"""
         except Exception:
             return base_threshold
 
+# One alternation per agent: a single regex search replaces the per-keyword substring checks
+# (keywords are matched as substrings of the lower-cased text, as before)
+_AGENT_KEYWORD_RE = {
+    name: re.compile("|".join(re.escape(keyword) for keyword in capability["keywords"]))
+    for name, capability in AgentSelector.AGENT_CAPABILITIES.items()
+}
+
 # Global instance
 agent_selector = AgentSelector()
@@ -0,0 +1,204 @@
+"""Dynamic batcher for Bedrock completions
+
+Agents that share a system prompt (e.g. several PatchOps deployments in flight)
+submit their prompts here instead of calling the client directly. Requests that
+arrive within a short window are coalesced into one Bedrock call: the shared
+system prompt plus numbered per-request sections, answered with a JSON array
+that is split back onto each caller's future. A window holding a single request
+is sent as-is, so a lone caller sees the same prompt as before, and is streamed
+when the caller passes `on_text`.
+
+Environment:
+    BEDROCK_BATCH_MAX_SIZE: Maximum requests per batched call (default 8)
+    BEDROCK_BATCH_MAX_WAIT_MS: How long to wait for more requests (default 100)
+"""
+import os
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock, Thread
+from typing import List, Optional
+
+import orjson
+
+from config.bedrock_client import get_client
+from config.terminal_logger import terminal_logger
+
+BATCH_INSTRUCTIONS = (
+    "You will receive several numbered requests. Answer each one independently. "
+    "Return a JSON array of strings where element j is the answer to request j. "
+    "Return only the JSON array."
+)
+BATCH_MAX_TOKENS = 8192
+MODEL_ID = os.getenv("STRANDS_MODEL_ID", "claude-sonnet-4-20250514")
+
+
+def build_batch_prompt(sections: List[str], label: str = "Request") -> str:
+    """Join per-request sections under numbered '### {label} j:' headers"""
+    return "\n".join(f"### {label} {j}:\n{section}" for j, section in enumerate(sections))
+
+
+def parse_batch_reply(text: str, expected: int) -> Optional[List[str]]:
+    """Extract the JSON array from a batched reply
+
+    Returns:
+        List of `expected` strings, or None if the reply is not a JSON array of that length
+    """
+    try:
+        parsed = orjson.loads(text[text.index("["):text.rindex("]") + 1])
+    except ValueError:
+        return None
+    if not isinstance(parsed, list) or len(parsed) != expected:
+        return None
+    return [item if isinstance(item, str) else str(item) for item in parsed]
+
+
+def _system_key(system):
+    """Hashable grouping key for a system prompt given as a string or content blocks"""
+    return system if isinstance(system, str) else orjson.dumps(system, option=orjson.OPT_SORT_KEYS)
+
+
+def _with_batch_instructions(system):
+    """Append the batching instructions after the (possibly cached) system prompt"""
+    if isinstance(system, str):
+        return f"{system}\n\n{BATCH_INSTRUCTIONS}"
+    return [*system, {"type": "text", "text": BATCH_INSTRUCTIONS}]
+
+
+class BedrockBatcher:
+    """Coalesces concurrent same-system-prompt requests into batched Bedrock calls"""
+
+    def __init__(self, max_batch: int = None, max_wait_ms: int = None):
+        self.max_batch = max_batch or int(os.getenv("BEDROCK_BATCH_MAX_SIZE", "8"))
+        self.max_wait = (max_wait_ms if max_wait_ms is not None
+                         else int(os.getenv("BEDROCK_BATCH_MAX_WAIT_MS", "100"))) / 1000.0
+        self._queue = queue.SimpleQueue()
+        # Worker pool and collector thread are started on first submit, so importing an
+        # agent module (e.g. on a Lambda cold start) costs nothing until a model call
+        self._pool = None
+        self._collector = None
+        self._start_lock = Lock()
+
+    def _ensure_started(self):
+        """Start the dispatch pool and collector thread once"""
+        if self._collector is not None:
+            return
+        with self._start_lock:
+            if self._collector is None:
+                # Batches are dispatched off the collector thread so the next window keeps filling
+                self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bedrock-batch")
+                collector = Thread(target=self._collect, name="bedrock-batcher", daemon=True)
+                collector.start()
+                self._collector = collector
+
+    def submit(self, system, prompt: str, max_tokens: int = 1024, on_text=None) -> Future:
+        """Queue a prompt; the future resolves to the response text
+
+        Args:
+            system: System prompt string, or a list of content blocks (e.g. marked
+                with cache_control); requests batch with identical system prompts
+            on_text: Optional callable fed text as it streams in. A request that
+                ends up in a multi-request batch receives its whole answer in one call.
+        """
+        self._ensure_started()
+        future = Future()
+        self._queue.put((system, prompt, max_tokens, on_text, future))
+        return future
+
+    def _collect(self):
+        """Gather requests for up to max_wait after the first arrives, then dispatch by system prompt"""
+        while True:
+            pending = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            groups = {}
+            for request in pending:
+                groups.setdefault((_system_key(request[0]), request[2]), []).append(request)
+            for (_, max_tokens), requests in groups.items():
+                system = requests[0][0]
+                try:
+                    self._pool.submit(self._dispatch, system, max_tokens, requests)
+                except RuntimeError as e:
+                    # Interpreter shutting down: fail the callers instead of the collector thread
+                    for *_, future in requests:
+                        future.set_exception(e)
+
+    def _dispatch(self, system, max_tokens, requests):
+        """Run one group and resolve its futures"""
+        try:
+            if len(requests) == 1:
+                texts = [self._call(system, requests[0][1], max_tokens, on_text=requests[0][3])]
+            else:
+                texts = self._call_batched(system, max_tokens, requests)
+        except Exception as e:
+            for *_, future in requests:
+                future.set_exception(e)
+            return
+        for (*_, future), text in zip(requests, texts):
+            future.set_result(text)
+
+    def _call_batched(self, system, max_tokens, requests):
+        """One call for the whole group; falls back to per-request calls on a malformed reply"""
+        prompt = build_batch_prompt([request[1] for request in requests])
+        texts = None
+        try:
+            text = self._call(
+                _with_batch_instructions(system),
+                prompt,
+                min(max_tokens * len(requests), BATCH_MAX_TOKENS)
+            )
+            texts = parse_batch_reply(text, len(requests))
+            if texts is None:
+                terminal_logger.add_log(
+                    f"Batched Bedrock reply did not match {len(requests)} requests - falling back to individual calls",
+                    "WARNING"
+                )
+        except Exception as e:
+            terminal_logger.add_log(
+                f"Batched Bedrock call failed: {str(e)} - falling back to individual calls",
+                "WARNING"
+            )
+
+        if texts is not None:
+            for (_, _, _, on_text, _), answer in zip(requests, texts):
+                if on_text:
+                    on_text(answer)
+            return texts
+        return [self._call(system, prompt, max_tokens, on_text=on_text) for _, prompt, _, on_text, _ in requests]
+
+    def _call(self, system, prompt, max_tokens, on_text=None):
+        kwargs = dict(
+            model=MODEL_ID,
+            max_tokens=max_tokens,
+            system=system,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+        messages_api = get_client().messages
+        if on_text:
+            response = messages_api.stream(on_text=on_text, **kwargs)
+        else:
+            response = messages_api.create(**kwargs)
+
+        # Prompt cache activity, for system prompts sent as cache_control blocks
+        usage = response.usage
+        if usage.cache_read_input_tokens or usage.cache_creation_input_tokens:
+            terminal_logger.add_log(
+                f"Bedrock prompt cache: {usage.cache_read_input_tokens} tokens read, "
+                f"{usage.cache_creation_input_tokens} tokens written",
+                "INFO"
+            )
+        return response.content[0].text
+
+
+# Global instance
+batcher = BedrockBatcher()
@@ -6,9 +6,20 @@ import os
 import time
 import random
 from typing import List, Dict, Optional
-from threading import Semaphore
+from threading import Lock, Semaphore
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from config.llm_cache import llm_cache
+
+AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
+
+# Common short model names -> Bedrock model IDs
+MODEL_MAP = {
+    'claude-sonnet-4-20250514': 'us.anthropic.claude-sonnet-4-20250514-v1:0',
+    'claude-3-5-sonnet-20241022': 'us.anthropic.claude-3-5-sonnet-20241022-v2:0',
+}
+
 
 class BedrockClient:
     """Wrapper for AWS Bedrock that provides Anthropic-like API with rate limiting"""
@@ -17,52 +28,176 @@ class BedrockClient:
     _semaphore = Semaphore(int(os.getenv('BEDROCK_MAX_CONCURRENT_REQUESTS', '3')))
 
     def __init__(self, region_name: str = None):
-        self.region_name = region_name or os.getenv('AWS_REGION', 'us-east-1')
+        self.region_name = region_name or AWS_REGION
         self.bedrock_runtime = boto3.client(
             service_name='bedrock-runtime',
-            region_name=self.region_name
+            region_name=self.region_name,
+            # Keep-alive connection pool sized for concurrent agent calls, so TLS/TCP
+            # handshakes are paid once per connection rather than per request
+            config=Config(
+                max_pool_connections=int(os.getenv('BEDROCK_MAX_POOL_CONNECTIONS', '32')),
+                tcp_keepalive=True
+            )
         )
         self.max_retries = int(os.getenv('BEDROCK_MAX_RETRIES', '5'))
+        # Route Claude cross-region profiles to latency-optimized endpoints when enabled
+        self.latency_optimized = os.getenv('BEDROCK_LATENCY_OPT', '0').lower() in ('1', 'true', 'yes')
+        # Built once; every input is fixed for the life of the client
+        self._messages = self.Messages(
+            self.bedrock_runtime,
+            self.region_name,
+            self.max_retries,
+            self._semaphore,
+            self.latency_optimized
+        )
 
     class Messages:
         """Messages API compatible with Anthropic SDK"""
 
-        def __init__(self, bedrock_runtime, region_name, max_retries, semaphore):
+        def __init__(self, bedrock_runtime, region_name, max_retries, semaphore, latency_optimized=False):
             self.bedrock_runtime = bedrock_runtime
             self.region_name = region_name
             self.max_retries = max_retries
             self.semaphore = semaphore
+            self.latency_optimized = latency_optimized
 
         def create(
             self,
             model: str,
             max_tokens: int,
-            system: str,
+            system,
             messages: List[Dict[str, str]],
             temperature: float = 1.0,
-            top_p: float = 0.999
+            top_p: float = 0.999,
+            no_cache: bool = False
         ):
             """Create a message using Bedrock API with rate limiting and retry logic
 
             Args:
                 model: Model ID (e.g., 'claude-sonnet-4-20250514')
                 max_tokens: Maximum tokens to generate
-                system: System prompt
+                system: System prompt, as a string or a list of content blocks
+                    (e.g. with cache_control for prompt caching)
                 messages: List of message dicts with 'role' and 'content'
                 temperature: Temperature for sampling
                 top_p: Top-p for sampling
+                no_cache: Skip the response cache and always invoke the model
 
             Returns:
                 Response object with .content[0].text attribute
             """
+            model, request_body, invoke_kwargs = self._prepare(
+                model, max_tokens, system, messages, temperature, top_p
+            )
+
+            # Identical requests within the TTL are served from the response cache
+            cache_key = None
+            if llm_cache.enabled and not no_cache:
+                cache_key = llm_cache.make_key(model, request_body)
+                cached_body = llm_cache.get(cache_key)
+                if cached_body is not None:
+                    return BedrockResponse(cached_body)
+
+            def invoke():
+                # Acquire semaphore to limit concurrent requests
+                with self.semaphore:
+                    # Call Bedrock
+                    response = self.bedrock_runtime.invoke_model(**invoke_kwargs)
+
+                    # Parse response
+                    return json.loads(response['body'].read())
+
+            response_body = self._with_retries(invoke)
+            if cache_key:
+                llm_cache.set(cache_key, response_body)
+
+            # Create response object that mimics Anthropic API
+            return BedrockResponse(response_body)
+
+        def stream(
+            self,
+            model: str,
+            max_tokens: int,
+            system,
+            messages: List[Dict[str, str]],
+            on_text=None,
+            temperature: float = 1.0,
+            top_p: float = 0.999,
+            no_cache: bool = False,
+            flush_chunks: int = 32,
+            flush_interval: float = 0.05
+        ):
+            """Like create(), but streams the completion and reports text as it arrives
+
+            Text deltas are buffered and handed to `on_text` every `flush_chunks`
+            deltas or `flush_interval` seconds, whichever comes first, so callers
+            can start downstream work without per-token callback overhead.
+
+            Args:
+                on_text: Optional callable receiving each flushed text fragment
+                flush_chunks: Deltas to buffer before calling on_text
+                flush_interval: Seconds after which buffered text is flushed regardless
+
+            Returns:
+                Response object with .content[0].text holding the full completion
+            """
+            model, request_body, invoke_kwargs = self._prepare(
+                model, max_tokens, system, messages, temperature, top_p
+            )
+
+            cache_key = None
+            if llm_cache.enabled and not no_cache:
+                cache_key = llm_cache.make_key(model, request_body)
+                cached_body = llm_cache.get(cache_key)
+                if cached_body is not None:
+                    if on_text:
+                        on_text(BedrockResponse(cached_body).content[0].text)
+                    return BedrockResponse(cached_body)
+
+            def invoke():
+                parts = []
+                pending = []
+                stop_reason = None
+                last_flush = time.monotonic()
+                with self.semaphore:
+                    response = self.bedrock_runtime.invoke_model_with_response_stream(**invoke_kwargs)
+                    for event in response['body']:
+                        chunk = event.get('chunk')
+                        if not chunk:
+                            continue
+                        payload = json.loads(chunk['bytes'])
+                        if payload.get('type') == 'content_block_delta':
+                            text = payload.get('delta', {}).get('text')
+                            if text:
+                                parts.append(text)
+                                pending.append(text)
+                        elif payload.get('type') == 'message_delta':
+                            stop_reason = payload.get('delta', {}).get('stop_reason')
+
+                        if on_text and pending and (
+                            len(pending) >= flush_chunks or time.monotonic() - last_flush >= flush_interval
+                        ):
+                            on_text(''.join(pending))
+                            pending = []
+                            last_flush = time.monotonic()
+
+                if on_text and pending:
+                    on_text(''.join(pending))
+                return {
+                    'content': [{'type': 'text', 'text': ''.join(parts)}],
+                    'stop_reason': stop_reason
+                }
+
+            response_body = self._with_retries(invoke)
+            if cache_key:
+                llm_cache.set(cache_key, response_body)
+            return BedrockResponse(response_body)
+
+        def _prepare(self, model, max_tokens, system, messages, temperature, top_p):
+            """Resolve the model ID and build the request body and invoke kwargs"""
             # Convert short model name to full Bedrock model ID if needed
             if not model.startswith('us.') and not model.startswith('anthropic.'):
-                # Map common model names to Bedrock IDs
-                model_map = {
-                    'claude-sonnet-4-20250514': 'us.anthropic.claude-sonnet-4-20250514-v1:0',
-                    'claude-3-5-sonnet-20241022': 'us.anthropic.claude-3-5-sonnet-20241022-v2:0',
-                }
-                model = model_map.get(model, f'us.anthropic.{model}-v1:0')
+                model = MODEL_MAP.get(model, f'us.anthropic.{model}-v1:0')
 
             # Build Bedrock request body
             request_body = {
@@ -74,23 +209,23 @@ class BedrockClient:
                 "top_p": top_p
             }
 
+            invoke_kwargs = {
+                'modelId': model,
+                'body': json.dumps(request_body)
+            }
+            # Latency-optimized inference is only offered on Claude cross-region profiles
+            if self.latency_optimized and model.startswith('us.anthropic.claude'):
+                invoke_kwargs['performanceConfigLatency'] = 'optimized'
+
+            return model, request_body, invoke_kwargs
+
+        def _with_retries(self, invoke):
+            """Run invoke() with exponential backoff on throttling"""
             # Retry logic with exponential backoff and semaphore-based rate limiting
             last_exception = None
             for attempt in range(self.max_retries):
                 try:
-                    # Acquire semaphore to limit concurrent requests
-                    with self.semaphore:
-                        # Call Bedrock
-                        response = self.bedrock_runtime.invoke_model(
-                            modelId=model,
-                            body=json.dumps(request_body)
-                        )
-
-                        # Parse response
-                        response_body = json.loads(response['body'].read())
-
-                        # Create response object that mimics Anthropic API
-                        return BedrockResponse(response_body)
+                    return invoke()
 
                 except ClientError as e:
                     error_code = e.response.get('Error', {}).get('Code', '')
@@ -115,12 +250,25 @@ class BedrockClient:
     @property
     def messages(self):
         """Return Messages API instance"""
-        return self.Messages(
-            self.bedrock_runtime,
-            self.region_name,
-            self.max_retries,
-            self._semaphore
-        )
+        return self._messages
+
+
+_shared_client = None
+_shared_client_lock = Lock()
+
+
+def get_client() -> BedrockClient:
+    """Return the process-wide BedrockClient, creating it on first use
+
+    Agents share one boto3 client (and its connection pool) instead of each
+    building their own at import time.
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = BedrockClient(region_name=AWS_REGION)
+    return _shared_client
 
 
 class BedrockResponse:
@@ -138,6 +286,21 @@ class BedrockResponse:
             self._content = [BedrockContentBlock(block) for block in content_blocks]
         return self._content
 
+    @property
+    def usage(self):
+        """Return token usage mimicking Anthropic API"""
+        return BedrockUsage(self.response_body.get('usage') or {})
+
+
+class BedrockUsage:
+    """Token usage that mimics Anthropic API usage; missing counters read as 0"""
+
+    def __init__(self, usage: Dict):
+        self.input_tokens = usage.get('input_tokens', 0)
+        self.output_tokens = usage.get('output_tokens', 0)
+        self.cache_creation_input_tokens = usage.get('cache_creation_input_tokens') or 0
+        self.cache_read_input_tokens = usage.get('cache_read_input_tokens') or 0
+
 
 class BedrockContentBlock:
     """Content block that mimics Anthropic API content block"""
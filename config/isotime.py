@@ -0,0 +1,20 @@
+"""Optional ciso8601 support for ISO-8601 timestamp parsing
+
+ciso8601 is not a hard requirement. When it is missing, `parse_iso` falls back
+to `datetime.fromisoformat`, so callers get the same datetime either way.
+"""
+from datetime import datetime
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+    _parse_datetime = None
+
+
+def parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 string (trailing 'Z' accepted); raises ValueError if malformed"""
+    if _parse_datetime is not None:
+        return _parse_datetime(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
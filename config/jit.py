@@ -0,0 +1,22 @@
+"""Optional Numba JIT support for numeric hot paths
+
+numba is not a hard requirement. When it is missing, `njit` becomes a no-op
+decorator and `prange` falls back to `range`, so kernels still run as plain
+Python/NumPy code.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit supporting both @njit and @njit(...) forms"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -0,0 +1,67 @@
+"""TTL cache for hot-path knowledge base pattern reads
+
+Every incident re-reads the pattern library (learned correlation patterns,
+past patch deployments) although it changes slowly. These wrappers memoize
+the reads for a short TTL. Cache keys include `kb.patterns_version`, which the
+KB bumps on every pattern write, so a new or updated pattern is visible on the
+next read. Incident writes do not touch the pattern library and keep the cache warm.
+
+Environment:
+    KB_CACHE_TTL_SECONDS: Entry lifetime in seconds (default 30, 0 disables)
+"""
+import functools
+import os
+import time
+from threading import Lock
+
+from config.knowledge_base import kb
+from config.learning import AgentLearning
+
+KB_CACHE_TTL_SECONDS = float(os.getenv("KB_CACHE_TTL_SECONDS", "30"))
+KB_CACHE_MAX_ENTRIES = 256
+
+
+def cached(ttl: float = KB_CACHE_TTL_SECONDS, maxsize: int = KB_CACHE_MAX_ENTRIES):
+    """Memoize a pattern library read on (args, kb.patterns_version) for `ttl` seconds"""
+
+    def decorator(func):
+        entries = {}
+        lock = Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            if ttl <= 0:
+                return func(*args)
+
+            key = (args, kb.patterns_version)
+            now = time.monotonic()
+            with lock:
+                hit = entries.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+
+            value = func(*args)
+            with lock:
+                if len(entries) >= maxsize:
+                    # Entries from older KB versions can never hit again; drop them first
+                    stale = [k for k in entries if k[1] != kb.patterns_version or now - entries[k][0] >= ttl]
+                    for k in stale or list(entries)[:maxsize // 2]:
+                        del entries[k]
+                entries[key] = (now, value)
+            return value
+
+        wrapper.cache_clear = lambda: entries.clear()
+        return wrapper
+    return decorator
+
+
+@cached()
+def get_patterns_by_type(pattern_type: str):
+    """Cached kb.get_patterns_by_type"""
+    return kb.get_patterns_by_type(pattern_type)
+
+
+@cached()
+def get_learned_patterns(agent_name: str, pattern_type: str):
+    """Cached AgentLearning.get_learned_patterns"""
+    return AgentLearning.get_learned_patterns(agent_name, pattern_type)
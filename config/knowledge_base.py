@@ -1,17 +1,66 @@
+import bisect
 import boto3
 import os
-from collections import deque
+import re
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Dict, List, Optional
+from config.isotime import parse_iso
+from agents.strands_tools import correlate_alerts
 import json
 import uuid
 
+# Fields recovered from alerts handed over as their repr string, e.g. "title='High CPU'"
+# or "severity=<Severity.HIGH: 'high'>"; one pattern picks up every field in a single scan
+_ALERT_REPR_FIELD = re.compile(r"\b(alert_id|title|severity|host)=(?:<[^:>]*: )?['\"]([^'\"]+)['\"]")
+
+
+def alert_correlation_confidence(alerts: List[Dict]) -> Optional[float]:
+    """correlate_alerts confidence for stored incident alert records, or None if it cannot be computed"""
+    try:
+        return correlate_alerts([
+            {
+                "alert_id": alert.get("alert_id"),
+                "title": alert.get("title", ""),
+                "host": alert.get("host", ""),
+                "timestamp": alert.get("timestamp"),
+                "severity": alert.get("severity", "medium"),
+            }
+            for alert in alerts
+        ]).get("confidence")
+    except Exception:
+        return None
+
+
+def _normalize_ts(ts, default: int) -> int:
+    """Epoch seconds (int) for an action timestamp; `default` when missing or unreadable"""
+    if isinstance(ts, bool) or ts is None:
+        return default
+    if isinstance(ts, (int, float)):
+        return int(ts)
+    try:
+        if isinstance(ts, str):
+            ts = parse_iso(ts)
+        return int(ts.timestamp())
+    except (AttributeError, ValueError, OverflowError, OSError):
+        return default
+
 
 class KnowledgeBase:
     """Persistent storage for agent memory and learning"""
 
     def __init__(self, use_local: bool = True):
         self.learning_enabled = os.getenv("LEARNING_LOOP_ENABLED", "true").lower() == "true"
+        # Bumped on every pattern library write; the pattern read caches key on it (see config/kb_cache.py).
+        # Incident writes leave it alone, so the live generator's incident stream does not evict them
+        self.patterns_version = 0
+        # agent name -> [(timestamp, action record), ...] in timestamp order, maintained on
+        # every incident action write so per-agent stats never scan all incidents
+        self.actions_by_agent = defaultdict(list)
+        # Bumped whenever actions_by_agent changes; the /api/agents snapshot keys on it
+        self.agents_version = 0
+        # (incident_id, action record) across all incidents in write order, for the global audit log
+        self.recent_actions_global = deque(maxlen=200)
 
         if use_local:
             # Local simulation for development
@@ -33,11 +82,20 @@ class KnowledgeBase:
     def store_incident(self, incident_data: Dict) -> str:
         """Store incident with agent decisions"""
         incident_id = incident_data.get('incident_id') or f"INC-{uuid.uuid4().hex[:8]}"
+        now = int(datetime.now().timestamp())
+        alerts = [self._alert_record(alert) for alert in incident_data.get('alerts', [])]
+
+        # Alert correlation confidence is computed here when the caller has none, so
+        # readers never have to compute it (and write it back) themselves
+        correlation_score = incident_data.get('correlation_score')
+        if correlation_score is None and alerts:
+            correlation_score = alert_correlation_confidence(alerts)
+        confidence = incident_data.get('confidence')
 
         record = {
             'incident_id': incident_id,
-            'timestamp': int(datetime.now().timestamp()),
-            'alerts': incident_data.get('alerts', []),
+            'timestamp': now,
+            'alerts': alerts,
             'root_cause': incident_data.get('root_cause'),
             'actions_taken': incident_data.get('actions_taken', []),
             'outcome': incident_data.get('outcome', 'pending'),
@@ -45,14 +103,28 @@ class KnowledgeBase:
             'metadata': incident_data.get('metadata', {}),
             # Processing state tracking
             'processing_state': incident_data.get('processing_state', 'created'),
-            'incident_actions': incident_data.get('incident_actions', []),  # Actions specific to this incident
-            'processing_timeline': incident_data.get('processing_timeline', [])  # Real timeline of events
+            'incident_actions': [
+                {**action, 'timestamp': _normalize_ts(action.get('timestamp'), now)}
+                for action in incident_data.get('incident_actions', [])
+            ],  # Actions specific to this incident
+            'processing_timeline': incident_data.get('processing_timeline', []),  # Real timeline of events
+            # Specialist outputs and the input hashes they were computed from, for incremental re-runs
+            'input_hashes': incident_data.get('input_hashes'),
+            'agent_outputs': incident_data.get('agent_outputs', {}),
+            # Unique alert hosts, so detail reads never derive them
+            'affected_components': incident_data.get('affected_components') or sorted(
+                {alert['host'] for alert in alerts if alert.get('host')}
+            ),
+            # Alert correlation confidence; refreshed by the orchestrator when analysis completes
+            'correlation_score': correlation_score,
+            'confidence': correlation_score if confidence is None else confidence
         }
 
         if self.local_mode:
             self.incident_memory[incident_id] = record
         else:
             self.incident_table.put_item(Item=record)
+        self._index_actions(incident_id, record['incident_actions'])
 
         return incident_id
 
@@ -97,6 +169,7 @@ class KnowledgeBase:
             self.pattern_library[pattern_id] = record
         else:
             self.pattern_table.put_item(Item=record)
+        self.patterns_version += 1
 
         return pattern_id
 
@@ -151,6 +224,7 @@ class KnowledgeBase:
                 if success:
                     successes += 1
                 pattern['success_rate'] = successes / pattern['occurrences']
+                self.patterns_version += 1
         # DynamoDB implementation would use UpdateItem
 
     # Incident-Specific Action Tracking
@@ -160,13 +234,26 @@ class KnowledgeBase:
         if incident:
             if 'incident_actions' not in incident:
                 incident['incident_actions'] = []
-            incident['incident_actions'].append({
-                'action_type': action.get('type'),
-                'agent': action.get('agent'),
-                'description': action.get('description'),
-                'timestamp': int(datetime.now().timestamp()),
-                'status': action.get('status', 'completed')
-            })
+            record = self._action_record(action, int(datetime.now().timestamp()))
+            incident['incident_actions'].append(record)
+            self._index_actions(incident_id, (record,))
+            self.incident_memory[incident_id] = incident
+
+    def add_incident_actions_bulk(self, incident_id: str, actions: List[Dict]) -> None:
+        """Add several actions to an incident with a single lookup and write
+
+        Actions may carry a 'timestamp' captured when they happened (epoch seconds,
+        datetime or ISO string); others are stamped now. Stored stamps are always int.
+        """
+        incident = self.get_incident(incident_id)
+        if incident:
+            now = int(datetime.now().timestamp())
+            records = [
+                self._action_record(action, _normalize_ts(action.get('timestamp'), now))
+                for action in actions
+            ]
+            incident.setdefault('incident_actions', []).extend(records)
+            self._index_actions(incident_id, records)
             self.incident_memory[incident_id] = incident
 
     def add_timeline_event(self, incident_id: str, event: Dict) -> None:
@@ -175,14 +262,75 @@ class KnowledgeBase:
         if incident:
             if 'processing_timeline' not in incident:
                 incident['processing_timeline'] = []
-            incident['processing_timeline'].append({
-                'timestamp': int(datetime.now().timestamp()),
-                'agent': event.get('agent'),
-                'event': event.get('event'),
-                'details': event.get('details', {})
-            })
+            incident['processing_timeline'].append(
+                self._timeline_record(event, int(datetime.now().timestamp()))
+            )
+            self.incident_memory[incident_id] = incident
+
+    def add_timeline_events_bulk(self, incident_id: str, events: List[Dict]) -> None:
+        """Add several timeline events to an incident with a single lookup and write
+
+        Events may carry an int 'timestamp' captured when they happened; others are stamped now.
+        """
+        incident = self.get_incident(incident_id)
+        if incident:
+            now = int(datetime.now().timestamp())
+            incident.setdefault('processing_timeline', []).extend(
+                self._timeline_record(event, event.get('timestamp') if isinstance(event.get('timestamp'), int) else now)
+                for event in events
+            )
             self.incident_memory[incident_id] = incident
 
+    def _index_actions(self, incident_id: str, records) -> None:
+        """Add action records to actions_by_agent (kept in timestamp order) and recent_actions_global"""
+        for record in records:
+            self.recent_actions_global.append((incident_id, record))
+            entries = self.actions_by_agent[record.get('agent')]
+            entry = (record.get('timestamp') or 0, record)
+            # Timestamps are almost always increasing, so this is normally a plain append
+            if not entries or entries[-1][0] <= entry[0]:
+                entries.append(entry)
+            else:
+                bisect.insort(entries, entry, key=lambda e: e[0])
+        if records:
+            self.agents_version += 1
+
+    def get_agent_actions(self, agent_name: str) -> List[tuple]:
+        """(timestamp, action) pairs recorded for an agent across all incidents, oldest first"""
+        return self.actions_by_agent.get(agent_name, ())
+
+    @staticmethod
+    def _alert_record(alert) -> Dict:
+        """Canonical dict form of an incident alert, so readers never need to sniff its type"""
+        if isinstance(alert, dict):
+            return alert
+        if hasattr(alert, 'model_dump'):
+            return alert.model_dump(mode='json')
+        record = {}
+        for name, value in _ALERT_REPR_FIELD.findall(str(alert)):
+            # First occurrence of each field wins, as with a per-field search
+            record.setdefault(name, value)
+        return record
+
+    @staticmethod
+    def _action_record(action: Dict, timestamp: int) -> Dict:
+        return {
+            'action_type': action.get('type'),
+            'agent': action.get('agent'),
+            'description': action.get('description'),
+            'timestamp': timestamp,
+            'status': action.get('status', 'completed')
+        }
+
+    @staticmethod
+    def _timeline_record(event: Dict, timestamp: int) -> Dict:
+        return {
+            'timestamp': timestamp,
+            'agent': event.get('agent'),
+            'event': event.get('event'),
+            'details': event.get('details', {})
+        }
+
     def update_incident_processing_state(self, incident_id: str, new_state: str) -> None:
         """Update the processing state of an incident"""
         incident = self.get_incident(incident_id)
@@ -204,6 +352,44 @@ class KnowledgeBase:
             return incident.get('processing_timeline', [])
         return []
 
+    # Learned Synthesis Templates
+    def get_synthesis_template(self, signature: str) -> Optional[Dict]:
+        """Get the learned synthesis template for an incident signature
+
+        Returns:
+            Dict with 'template' (a str.format template over the incident's fields),
+            'confidence', 'samples' and 'uses', or None if unseen
+        """
+        return self.get_agent_knowledge("Orchestrator", f"synthesis_template:{signature}")
+
+    def store_synthesis_template(self, signature: str, template: str, learning_rate: float = 0.3) -> Dict:
+        """Record a synthesis template built from a model response for an incident signature
+
+        Each recurrence of the signature raises confidence toward 1.0, in the
+        same way as AgentLearning.improve_confidence, keeps the latest template
+        and resets its reuse count.
+        """
+        current = self.get_synthesis_template(signature) or {"confidence": 0.5, "samples": 0}
+        samples = current["samples"] + 1
+        confidence = current["confidence"] if samples == 1 else (
+            current["confidence"] + (1 - current["confidence"]) * learning_rate
+        )
+        record = {
+            "template": template,
+            "confidence": round(confidence, 3),
+            "samples": samples,
+            "uses": 0
+        }
+        self.store_agent_knowledge("Orchestrator", f"synthesis_template:{signature}", record)
+        return record
+
+    def record_synthesis_template_use(self, signature: str):
+        """Count one reuse of a learned synthesis template in place of a model call"""
+        record = self.get_synthesis_template(signature)
+        if record:
+            record["uses"] = record.get("uses", 0) + 1
+            self.store_agent_knowledge("Orchestrator", f"synthesis_template:{signature}", record)
+
     # Agent Selection Pattern Learning
     def record_agent_selection(self, keywords: List[str], agents_used: List[str], outcome_quality: float):
         """Record which agents were selected for which keywords and how successful it was
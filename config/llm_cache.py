@@ -0,0 +1,79 @@
+"""Exact-match response cache for Bedrock completions
+
+Recurring alert storms produce identical prompts (same hosts, same titles), so
+BedrockClient checks this cache before invoking the model. Entries are keyed on
+a SHA-256 of the model ID plus the full request body and expire after a TTL.
+
+Environment:
+    LLM_CACHE_ENABLED: "true" (default) or "false"
+    LLM_CACHE_TTL_SECONDS: Entry lifetime in seconds (default 3600)
+    LLM_CACHE_PATH: SQLite database path (default in-memory, per process)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import Dict, Optional
+
+import orjson
+
+
+class LLMCache:
+    """SQLite-backed TTL cache of raw Bedrock response bodies"""
+
+    def __init__(self, path: str = None, ttl_seconds: int = None):
+        self.enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+        self.path = path or os.getenv("LLM_CACHE_PATH", ":memory:")
+        self._lock = Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, request_body: Dict) -> str:
+        """Hash the model ID and request body (system, messages, sampling params)"""
+        payload = model.encode("utf-8") + orjson.dumps(request_body, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached response body, or None on miss/expiry"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, ts FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        response, ts = row
+        if time.time() - ts > self.ttl_seconds:
+            with self._lock:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+            return None
+        return json.loads(response)
+
+    def set(self, key: str, response_body: Dict):
+        """Store a response body and drop any expired entries"""
+        now = int(time.time())
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, json.dumps(response_body), now)
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE ts < ?", (now - self.ttl_seconds,))
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+
+# Global instance
+llm_cache = LLMCache()
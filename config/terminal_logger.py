@@ -15,10 +15,15 @@ Usage:
     # No backend output (frontend only)
     TERMINAL_OUTPUT=none python backend_api.py
 """
-from collections import deque
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime
-from threading import Lock
+from itertools import islice
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread, local
+import atexit
 import os
+import sys
 
 
 class TerminalLogger:
@@ -56,6 +61,18 @@ class TerminalLogger:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
                     cls._instance.log_buffer = deque(maxlen=1000)
+                    # The same entries split by type (oldest first), so filtered reads never
+                    # scan the whole buffer; kept to exactly the entries still in log_buffer
+                    cls._instance._by_type = defaultdict(deque)
+                    # Agents log from worker threads, so buffer writes and enqueues are serialized
+                    cls._instance._write_lock = Lock()
+                    # Per-thread pending entries while inside a batch() block
+                    cls._instance._batch_state = local()
+
+                    # Console output is written by a background thread so add_log never blocks on stdout
+                    cls._instance._console_queue = SimpleQueue()
+                    Thread(target=cls._instance._drain_console, name="terminal-logger", daemon=True).start()
+                    atexit.register(cls._instance.flush_console)
 
                     # Read output mode from environment variable
                     # Options: "full", "selective", "none"
@@ -84,29 +101,130 @@ class TerminalLogger:
             "agent": agent,
             "message": message
         }
-        self.log_buffer.append(log_entry)
 
-        # Print to backend terminal based on output mode
-        if self.output_mode != "none":
-            should_print = False
+        # Inside batch(): hold the entry until the block exits
+        pending = getattr(self._batch_state, "entries", None)
+        if pending is not None:
+            pending.append(log_entry)
+            return
+
+        self._commit([log_entry])
+
+    @contextmanager
+    def batch(self):
+        """
+        Buffer this thread's add_log calls and publish them together on exit.
+
+        Entries keep their original timestamps and their order relative to this
+        thread's other lines; the shared buffer lock is taken once per block
+        instead of once per log line. Nested blocks flush with the outermost one.
+        Lines logged by other threads (e.g. a stream_progress callback) are
+        published immediately, so call flush_batch() before waiting on them.
+        """
+        state = self._batch_state
+        if getattr(state, "entries", None) is not None:
+            yield
+            return
+
+        state.entries = []
+        try:
+            yield
+        finally:
+            entries, state.entries = state.entries, None
+            if entries:
+                self._commit(entries)
+
+    def flush_batch(self):
+        """Publish this thread's pending batch() entries now; the block stays open"""
+        state = self._batch_state
+        entries = getattr(state, "entries", None)
+        if entries:
+            state.entries = []
+            self._commit(entries)
+
+    def _commit(self, entries):
+        """Append entries to the shared buffer and queue console output, under one lock"""
+        with self._write_lock:
+            buffer = self.log_buffer
+            by_type = self._by_type
+            for entry in entries:
+                if len(buffer) == buffer.maxlen:
+                    # The entry about to be evicted is also the oldest of its type
+                    by_type[buffer[0]["type"]].popleft()
+                buffer.append(entry)
+                by_type[entry["type"]].append(entry)
+
+            # Print to backend terminal based on output mode
+            if self.output_mode != "none":
+                for entry in entries:
+                    should_print = False
+
+                    if self.output_mode == "full":
+                        # Print all logs
+                        should_print = True
+                    elif self.output_mode == "selective":
+                        # Print only important logs
+                        should_print = entry["type"] in self.important_types
 
-            if self.output_mode == "full":
-                # Print all logs
-                should_print = True
-            elif self.output_mode == "selective":
-                # Print only important logs
-                should_print = log_type in self.important_types
+                    if should_print:
+                        self._console_queue.put_nowait((entry["timestamp"], entry["type"], entry["message"]))
 
-            if should_print:
-                self._print_to_console(timestamp, log_type, message)
+    def stream_progress(self, message: str, log_type: str = "INFO", every_chars: int = 800):
+        """
+        Build an on_text callback that narrates a streaming LLM response.
+
+        Logs `message` when the first text arrives and again each time another
+        `every_chars` characters have been received.
+
+        Args:
+            message: Narrative prefix, e.g. "PredictiveOps receiving risk assessment"
+            log_type: Type of log for the progress lines
+            every_chars: Characters between progress lines
+        """
+        state = {"received": 0, "next_mark": 0}
+
+        def on_text(text: str):
+            state["received"] += len(text)
+            if state["received"] > state["next_mark"]:
+                self.add_log(f"{message} ({state['received']} chars received)", log_type)
+                state["next_mark"] = (state["received"] // every_chars + 1) * every_chars
 
-    def _print_to_console(self, timestamp: str, log_type: str, message: str):
-        """Print a colored log entry to the backend console"""
+        return on_text
+
+    def _format_console_line(self, timestamp: str, log_type: str, message: str) -> str:
+        """Format a colored log entry for the backend console"""
         color = self.COLORS.get(log_type, self.COLORS['INFO'])
         reset = self.COLORS['RESET']
 
         # Format: [HH:MM:SS] [TYPE] Message
-        print(f"{color}[{timestamp}] [{log_type:14}]{reset} {message}")
+        return f"{color}[{timestamp}] [{log_type:14}]{reset} {message}\n"
+
+    def _drain_console(self, batch_size: int = 64):
+        """Background loop: block for the next entry, then write whatever else is queued in one go"""
+        while True:
+            batch = [self._console_queue.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(self._console_queue.get_nowait())
+                except Empty:
+                    break
+            self._write_console(batch)
+
+    def _write_console(self, batch):
+        """Write a batch of (timestamp, log_type, message) entries with a single stdout call"""
+        sys.stdout.write("".join(self._format_console_line(*entry) for entry in batch))
+        sys.stdout.flush()
+
+    def flush_console(self):
+        """Write any queued console entries synchronously (used at interpreter exit)"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._console_queue.get_nowait())
+            except Empty:
+                break
+        if batch:
+            self._write_console(batch)
 
     def get_logs(self, limit: int = None, log_type: str = None):
         """
@@ -119,20 +237,25 @@ class TerminalLogger:
         Returns:
             List of log entries (most recent last)
         """
-        logs = list(self.log_buffer)
-
-        # Filter by log_type if specified
+        # Filtered reads come straight from the per-type index
         if log_type and log_type != "ALL":
-            logs = [log for log in logs if log.get('type') == log_type]
+            source = self._by_type.get(log_type, ())
+        else:
+            source = self.log_buffer
 
-        # Apply limit
-        if limit:
-            return logs[-limit:]
+        # Copy under the write lock: deques cannot be iterated while another thread appends
+        with self._write_lock:
+            if not limit:
+                return list(source)
+            logs = list(islice(reversed(source), limit))
+        logs.reverse()
         return logs
 
     def clear_logs(self):
         """Clear all logs from the buffer"""
-        self.log_buffer.clear()
+        with self._write_lock:
+            self.log_buffer.clear()
+            self._by_type.clear()
 
     def set_output_mode(self, mode: str):
         """
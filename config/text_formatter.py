@@ -1,7 +1,9 @@
 """Text formatting utilities for enterprise-grade display"""
 import re
+from functools import lru_cache
 from typing import Dict
 from datetime import datetime
+from config.isotime import parse_iso
 
 def format_llm_synthesis(raw_text: str, max_length: int = 200, truncate: bool = True) -> str:
     """
@@ -310,21 +312,45 @@ def truncate_smart(text: str, max_length: int, suffix: str = '...') -> str:
     return text[:max_length].rsplit(' ', 1)[0] + suffix
 
 
+# strftime patterns by format_type; unknown types use 'full'
+DATETIME_FORMATS = {
+    'full': '%b %d, %Y at %I:%M %p',   # "Oct 17, 2025 at 7:04 PM"
+    'date': '%b %d, %Y',               # "Oct 17, 2025"
+    'time': '%I:%M %p',                # "7:04 PM"
+    'short': '%b %d, %I:%M %p',        # "Oct 17, 7:04 PM"
+}
+
+
+# Actions, alerts and timeline events share second-granularity timestamps across
+# polls, so most formatting calls repeat an earlier one
+@lru_cache(maxsize=4096)
+def _format_epoch(ts: int, format_type: str) -> str:
+    return datetime.fromtimestamp(ts).strftime(DATETIME_FORMATS.get(format_type, DATETIME_FORMATS['full']))
+
+
+@lru_cache(maxsize=4096)
+def _format_minute(dt: datetime, format_type: str) -> str:
+    return dt.strftime(DATETIME_FORMATS.get(format_type, DATETIME_FORMATS['full']))
+
+
 def format_datetime(dt_input, format_type: str = 'full') -> str:
     """
     Format datetime for enterprise display.
 
     Args:
-        dt_input: datetime object or ISO string
+        dt_input: datetime object, ISO string, or epoch seconds
         format_type: 'full', 'date', 'time', 'short'
 
     Returns:
         Formatted datetime string
     """
+    if isinstance(dt_input, (int, float)) and not isinstance(dt_input, bool):
+        return _format_epoch(int(dt_input), format_type)
+
     # Convert to datetime object if string
     if isinstance(dt_input, str):
         try:
-            dt = datetime.fromisoformat(dt_input.replace('Z', '+00:00'))
+            dt = parse_iso(dt_input)
         except (ValueError, AttributeError):
             return dt_input  # Return as-is if can't parse
     elif isinstance(dt_input, datetime):
@@ -332,18 +358,5 @@ def format_datetime(dt_input, format_type: str = 'full') -> str:
     else:
         return str(dt_input)
 
-    # Format based on type
-    if format_type == 'full':
-        # "Oct 17, 2025 at 7:04 PM"
-        return dt.strftime('%b %d, %Y at %I:%M %p')
-    elif format_type == 'date':
-        # "Oct 17, 2025"
-        return dt.strftime('%b %d, %Y')
-    elif format_type == 'time':
-        # "7:04 PM"
-        return dt.strftime('%I:%M %p')
-    elif format_type == 'short':
-        # "Oct 17, 7:04 PM"
-        return dt.strftime('%b %d, %I:%M %p')
-    else:
-        return dt.strftime('%b %d, %Y at %I:%M %p')
+    # No format shows seconds, so truncating keeps the cache key coarse
+    return _format_minute(dt.replace(second=0, microsecond=0), format_type)
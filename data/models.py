@@ -1,7 +1,10 @@
 ﻿from pydantic import BaseModel, Field
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+import numpy as np
+import pandas as pd
 
 class Severity(str, Enum):
     CRITICAL = "critical"
@@ -42,4 +45,50 @@ class CorrelationResult(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0)
     root_cause: str
     reasoning: List[str]
-    suppressed_count: int
\ No newline at end of file
+    suppressed_count: int
+
+@dataclass
+class MetricBatch:
+    """Column-oriented (structure-of-arrays) view of a list of Metric objects
+
+    Built once at the analysis boundary so grouping and trend math run on
+    NumPy columns instead of walking Metric attributes per element.
+    Timestamps are normalized to naive UTC datetime64.
+    """
+    host: np.ndarray         # object array of str
+    metric_name: np.ndarray  # object array of str
+    value: np.ndarray        # float64
+    timestamp: np.ndarray    # datetime64[us], UTC
+
+    @classmethod
+    def from_metrics(cls, metrics: List[Metric]) -> "MetricBatch":
+        """Single pass over Metric objects into columns"""
+        hosts, names, values, stamps = [], [], [], []
+        for m in metrics:
+            hosts.append(m.host)
+            names.append(m.metric_name)
+            values.append(m.value)
+            stamps.append(m.timestamp)
+        ts = pd.to_datetime(pd.Series(stamps, dtype=object), utc=True, format="mixed")
+        return cls(
+            host=np.array(hosts, dtype=object),
+            metric_name=np.array(names, dtype=object),
+            value=np.array(values, dtype=np.float64),
+            timestamp=ts.dt.tz_localize(None).to_numpy(dtype="datetime64[us]"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def series(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct 'host_metric' keys and each point's index into them"""
+        keys = self.host.astype(str) + "_" + self.metric_name.astype(str)
+        return np.unique(keys, return_inverse=True)
+
+    def to_dicts(self) -> List[dict]:
+        """Row dicts (ISO timestamps) for tools that take a list of metric dicts"""
+        iso = np.datetime_as_string(self.timestamp).tolist()
+        return [
+            {"host": h, "metric_name": n, "value": v, "timestamp": t}
+            for h, n, v, t in zip(self.host.tolist(), self.metric_name.tolist(), self.value.tolist(), iso)
+        ]
\ No newline at end of file
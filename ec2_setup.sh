@@ -13,7 +13,7 @@ sudo chown -R ubuntu:ubuntu /opt/opsforge
 
 echo "Installing Python packages..."
 cd /opt/opsforge
-pip3 install fastapi uvicorn boto3 pydantic networkx anthropic python-dotenv
+pip3 install fastapi uvicorn boto3 pydantic anthropic python-dotenv
 
 echo "Installing Node packages..."
 cd /opt/opsforge/frontend
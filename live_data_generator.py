@@ -1,5 +1,7 @@
 import asyncio
+import functools
 import random
+from collections import deque
 from datetime import datetime, timedelta
 from data.alert_simulator import AlertSimulator
 from data.metrics_simulator import MetricsSimulator
@@ -8,6 +10,10 @@ from agents.ets_forecaster import generate_ets_summary
 from config.knowledge_base import kb
 from config.action_executor import executor
 from config.terminal_logger import terminal_logger
+from config.isotime import parse_iso
+
+# Dashboard polls re-format the same stored ISO timestamps every few seconds
+_parse_isoformat = functools.lru_cache(maxsize=2048)(parse_iso)
 
 class LiveDataGenerator:
     # ===== CONFIGURATION CONSTANTS =====
@@ -19,6 +25,7 @@ class LiveDataGenerator:
 
     # Action execution configuration
     ACTION_EXECUTION_PROBABILITY = 0.20  # Probability to execute action (80% = > 0.2)
+    RECENT_ACTIONS_LIMIT = 50            # Recent actions kept for the dashboard (overall and per agent)
 
     def __init__(self):
         self.alert_sim = AlertSimulator()
@@ -27,6 +34,11 @@ class LiveDataGenerator:
         self.kill_switch_active = False
         self.simulation_running = False  # Controls incident generation (Start/Stop button)
         self.patches = []
+        # Bumped whenever patches are added, progressed or cleaned up, so API
+        # snapshots of the patch list are rebuilt only after a change
+        self.patches_version = 0
+        # Same patch dicts keyed by id, for detail lookups
+        self.patches_by_id = {}
         self.patch_counter = 0
 
         # Log buffer for terminal viewer
@@ -51,7 +63,8 @@ class LiveDataGenerator:
         # FIX: Combined metrics cache with proper initialization
         self.metrics_cache = {**self.base_metrics, **self.dynamic_metrics}
         
-        self.recent_actions = []
+        # Newest first; the deque drops the oldest entry once the limit is reached
+        self.recent_actions = deque(maxlen=self.RECENT_ACTIONS_LIMIT)
         self.incident_times = {}
         
         # FIX: Add metrics lock for thread-safe updates
@@ -121,14 +134,15 @@ class LiveDataGenerator:
 
     # Removed add_log and get_logs methods - now using shared terminal_logger
 
-    def _get_relative_time(self, timestamp):
+    def _get_relative_time(self, timestamp, now=None):
+        """Human-readable age of a timestamp; list endpoints pass one `now` for all rows"""
         if isinstance(timestamp, str):
             try:
-                timestamp = datetime.fromisoformat(timestamp)
+                timestamp = _parse_isoformat(timestamp)
             except ValueError:
                 return timestamp
 
-        delta = datetime.now() - timestamp
+        delta = (now or datetime.now()) - timestamp
         total_seconds = delta.total_seconds()
 
         if total_seconds < 60:
@@ -224,11 +238,8 @@ class LiveDataGenerator:
         component = "system"
         
         if alerts:
-            if isinstance(alerts[0], dict):
-                alert_title = alerts[0].get('title', '')
-            else:
-                alert_title = str(alerts[0])
-            
+            alert_title = alerts[0].get('title', '')
+
             if "database" in alert_title.lower():
                 component = "database"
             elif "web" in alert_title.lower() or "nginx" in alert_title.lower():
@@ -542,17 +553,13 @@ class LiveDataGenerator:
                         })
 
                         # Add to recent actions for dashboard display
-                        self.recent_actions.insert(0, {
+                        self.recent_actions.appendleft({
                             "agent": agent,
                             "action": "Analyzed incident",
                             "timestamp": analysis_time,
                             "relative_time": self._get_relative_time(analysis_time)
                         })
 
-                    # Trim recent actions to prevent memory bloat
-                    if len(self.recent_actions) > 50:
-                        self.recent_actions = self.recent_actions[:50]
-
                     # Generate patch with the actual incident record
                     incident_record = kb.get_incident(incident_id)
                     if incident_record:
@@ -568,6 +575,8 @@ class LiveDataGenerator:
                             new_patch = self.generate_patch_from_incident(incident_record)
                             new_patch['incident_id'] = incident_id
                             self.patches.append(new_patch)
+                            self.patches_by_id[new_patch['id']] = new_patch
+                            self.patches_version += 1
                             print(f"📦 Generated patch: {new_patch['name']}")
 
                             # NARRATIVE: Patch generation
@@ -584,15 +593,23 @@ class LiveDataGenerator:
                         action_time = datetime.now()
                         executed_actions = []
 
-                        for agent in agents_used:
-                            action = {
+                        actions = [
+                            {
                                 "type": random.choice(["suppress_alerts", "restart_service", "clear_cache"]),
                                 "params": {"host": f"host-{random.randint(1, 10)}"},
                                 "risk_level": "LOW",
                                 "agent": agent
                             }
-
-                            exec_result = executor.execute_action(action, incident_id=incident_id)
+                            for agent in agents_used
+                        ]
+                        # Run the agents' actions concurrently off the event loop; API requests
+                        # keep being served while services "restart"
+                        await asyncio.gather(*(
+                            executor.execute_action_async(action, incident_id=incident_id)
+                            for action in actions
+                        ))
+
+                        for agent, action in zip(agents_used, actions):
                             executed_actions.append(f"{agent}: {action['type']}")
 
                             kb.add_incident_action(incident_id, {
@@ -604,16 +621,13 @@ class LiveDataGenerator:
                                 'timestamp': action_time
                             })
 
-                            self.recent_actions.insert(0, {
+                            self.recent_actions.appendleft({
                                 "agent": agent,
                                 "action": f"Executed {action['type']}",
                                 "timestamp": action_time,
                                 "relative_time": self._get_relative_time(action_time)
                             })
 
-                        if len(self.recent_actions) > 50:
-                            self.recent_actions = self.recent_actions[:50]
-
                         # NARRATIVE: Actions executed
                         for action_desc in executed_actions:
                             terminal_logger.add_log(f"Executed action: {action_desc}", "TASKOPS")
@@ -696,8 +710,15 @@ class LiveDataGenerator:
                     })
 
                     # Clean up old completed patches
-                    self.patches = [p for p in self.patches if p['status'] != 'completed' or
-                                   (datetime.now() - p['created_at']).total_seconds() < self.PATCH_RETENTION_SECONDS]
+                    now = datetime.now()
+                    kept = []
+                    for p in self.patches:
+                        if p['status'] != 'completed' or (now - p['created_at']).total_seconds() < self.PATCH_RETENTION_SECONDS:
+                            kept.append(p)
+                        else:
+                            self.patches_by_id.pop(p['id'], None)
+                    self.patches = kept
+                    self.patches_version += 1
 
                     await asyncio.sleep(random.randint(30, 60))
                 else:
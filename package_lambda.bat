@@ -10,9 +10,11 @@ xcopy /E /I agents lambda_package\agents
 xcopy /E /I config lambda_package\config
 xcopy /E /I data lambda_package\data
 copy aws\lambda_handler.py lambda_package\
+mkdir lambda_package\aws
+copy aws\parsers.py lambda_package\aws\
 
 :: Install dependencies (no anthropic, no strands)
-pip install --target lambda_package boto3 pydantic networkx fastapi python-dotenv
+pip install --target lambda_package boto3 pydantic fastapi python-dotenv orjson numpy pandas
 
 :: Create ZIP
 cd lambda_package
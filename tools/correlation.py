@@ -1,7 +1,7 @@
 from strands.tools import tool
 from typing import List, Dict
+from collections import defaultdict
 from datetime import timedelta
-import networkx as nx
 
 @tool
 def correlate_alerts(alerts: List[Dict]) -> Dict:
@@ -24,28 +24,31 @@ def correlate_alerts(alerts: List[Dict]) -> Dict:
             "suppressed_count": 0
         }
     
-    # Build correlation graph
-    G = nx.Graph()
-    
-    for alert in alerts:
-        G.add_node(alert["alert_id"], **alert)
-    
-    # Add edges based on correlation factors
+    # Union-find over alert indices; the root of each cluster is its smallest index
+    parent = list(range(len(alerts)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    linked = False
+
+    # Link alerts based on correlation factors
     for i, alert1 in enumerate(alerts):
-        for alert2 in alerts[i+1:]:
+        for j in range(i + 1, len(alerts)):
+            alert2 = alerts[j]
             score = 0.0
-            reasons = []
             
             # Same host correlation
             if alert1["host"] == alert2["host"]:
                 score += 0.4
-                reasons.append("same_host")
             
             # Time proximity (within 60 seconds)
             time_diff = abs((alert1["timestamp"] - alert2["timestamp"]).total_seconds())
             if time_diff < 60:
                 score += 0.3
-                reasons.append("time_proximity")
             
             # Keyword matching
             keywords1 = set(alert1["title"].lower().split())
@@ -53,20 +56,22 @@ def correlate_alerts(alerts: List[Dict]) -> Dict:
             overlap = len(keywords1 & keywords2)
             if overlap > 0:
                 score += min(0.3, overlap * 0.1)
-                reasons.append("keyword_match")
             
             if score > 0.5:
-                G.add_edge(alert1["alert_id"], alert2["alert_id"], 
-                          weight=score, reasons=reasons)
+                linked = True
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[max(ri, rj)] = min(ri, rj)
     
-    # Find largest connected component (main incident cluster)
-    if G.number_of_edges() > 0:
-        components = list(nx.connected_components(G))
-        largest = max(components, key=len)
+    # Find largest cluster (main incident cluster)
+    if linked:
+        clusters = defaultdict(list)
+        for i in range(len(alerts)):
+            clusters[find(i)].append(i)
+        largest = max(clusters.values(), key=len)
         
         # Identify root cause (earliest alert in cluster)
-        cluster_alerts = [alerts[i] for i, a in enumerate(alerts) 
-                         if a["alert_id"] in largest]
+        cluster_alerts = [alerts[i] for i in largest]
         cluster_alerts.sort(key=lambda x: x["timestamp"])
         primary = cluster_alerts[0]
         